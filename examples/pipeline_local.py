@@ -7,6 +7,7 @@ Uses only LMStudio — no API keys, no cost.
 
 Run: python examples/pipeline_local.py
      python examples/pipeline_local.py --seed "Plan a mars colony" --rounds 5
+     python examples/pipeline_local.py --seeds "Plan a mars colony" "Design a language"
 
 Requires: LMStudio running at http://127.0.0.1:1234
 """
@@ -20,10 +21,11 @@ from gumdrop import Cartridge, Session, Pipeline, Probe
 def print_exchange(speaker: str, message: str, round_num: int):
     """Pretty-print each exchange."""
     emoji = "🟢" if round_num % 2 == 1 else "🔵"  # alternates aren't exact but close enough
-    print(f"\n{emoji} [{speaker}] (round {round_num}):")
-    print(message[:800])
+    block = f"\n{emoji} [{speaker}] (round {round_num}):\n{message[:800]}\n"
     if len(message) > 800:
-        print(f"  [...{len(message)} chars total]")
+        block += f"  [...{len(message)} chars total]\n"
+    sys.stdout.write(block)  # one write per exchange
+    sys.stdout.flush()
 
 
 def main():
@@ -32,6 +34,10 @@ def main():
         "--seed", default="What does it mean for an AI to have an identity?",
         help="Seed prompt to start the conversation",
     )
+    parser.add_argument(
+        "--seeds", nargs="+", metavar="SEED",
+        help="Run independent conversations for several seeds concurrently",
+    )
     parser.add_argument("--rounds", type=int, default=5, help="Number of rounds")
     parser.add_argument("--log", default="pipeline_log.jsonl", help="Log file path")
     parser.add_argument(
@@ -109,6 +115,10 @@ def main():
         on_exchange=print_exchange,
     )
 
+    if args.seeds:
+        run_batch(pipe, args)
+        return
+
     print(f"{'='*60}")
     print(f"  GUMDROP PIPELINE")
     print(f"  Seed: {args.seed}")
@@ -140,10 +150,30 @@ def main():
     # Save transcript
     transcript = pipe.get_transcript()
     transcript_path = args.log.replace(".jsonl", "_transcript.txt")
-    with open(transcript_path, "w") as f:
-        f.write(transcript)
+    with open(transcript_path, "wb") as f:
+        f.write(transcript.encode("utf-8"))
     print(f"  Transcript: {transcript_path}")
 
 
+def run_batch(pipe: Pipeline, args):
+    """Fan out one conversation per seed and summarize each."""
+    print(f"{'='*60}")
+    print(f"  GUMDROP PIPELINE (batch x{len(args.seeds)})")
+    print(f"  Edge: Spark ({args.edge_model})")
+    print(f"  Cloud: Root ({args.cloud_model})")
+    print(f"  Rounds: {args.rounds}")
+    print(f"{'='*60}")
+
+    probes = pipe.run_batch(args.seeds, rounds=args.rounds)
+
+    print(f"\n{'='*60}")
+    print(f"  RESULTS")
+    for seed, probe in zip(args.seeds, probes):
+        summary = probe.summary()
+        print(f"  {seed[:40]!r}: {summary['exchanges']} exchanges, "
+              f"compression {summary['compression_ratio']}x")
+    print(f"{'='*60}")
+
+
 if __name__ == "__main__":
     main()
@@ -15,7 +15,7 @@ Run: python examples/signed_cartridge.py
 from pathlib import Path
 from gumdrop import Cartridge
 from gumdrop.keyring import Keyring, Signer
-from gumdrop.visual import ic_panel_from_cartridge, ribbon_panel_from_cartridge
+from gumdrop.visual import ic_panel_to_path, ribbon_panel_to_path
 from gumdrop.thumbprint import from_cartridge, compact
 
 OUTPUT = Path("output/signed")
@@ -104,11 +104,11 @@ print(f"\n  Compact: {compact(loaded.identity.traits, loaded.identity.name, load
 
 # SVG renders
 ic_path = OUTPUT / "meridian_ic.svg"
-ic_path.write_text(ic_panel_from_cartridge(loaded))
+ic_panel_to_path(loaded, ic_path)
 print(f"\n  IC Panel:     {ic_path}")
 
 ribbon_path = OUTPUT / "meridian_ribbon.svg"
-ribbon_path.write_text(ribbon_panel_from_cartridge(loaded))
+ribbon_panel_to_path(loaded, ribbon_path)
 print(f"  Ribbon Panel: {ribbon_path}")
 
 print()
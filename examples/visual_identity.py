@@ -5,12 +5,16 @@ visual_identity.py — Generate IC chip panels and ribbon panels for cartridges.
 Outputs SVG files you can view in any browser.
 
 Run: python examples/visual_identity.py
+     python examples/visual_identity.py --workers 1   (no process pool)
 Then: open output/  (or browse the SVG files)
 """
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+
 from gumdrop import Cartridge
-from gumdrop.visual import ic_panel_from_cartridge, ribbon_panel_from_cartridge, get_palette
+from gumdrop.visual import ic_panel_bytes_from_cartridge, ribbon_panel_bytes_from_cartridge, get_palettes
 
 OUTPUT = Path("output/visual")
 OUTPUT.mkdir(parents=True, exist_ok=True)
@@ -56,44 +60,67 @@ PERSONAS = {
 }
 
 
-for key, persona in PERSONAS.items():
+def render_one(item):
+    """Render one persona's panels; runs in a worker process."""
+    key, persona = item
     cart = Cartridge.create(**persona)
-    palette = get_palette(persona["traits"])
-    
-    # IC Panel
-    ic_svg = ic_panel_from_cartridge(cart)
-    ic_path = OUTPUT / f"{key}_ic.svg"
-    ic_path.write_text(ic_svg)
-    
-    # Ribbon Panel
-    ribbon_svg = ribbon_panel_from_cartridge(cart)
-    ribbon_path = OUTPUT / f"{key}_ribbon.svg"
-    ribbon_path.write_text(ribbon_svg)
-    
-    print(f"{persona['name']:10s} hue={palette['hue']:5.1f}° bg={palette['bg']}  → {ic_path}, {ribbon_path}")
-
-
-# Also generate an HTML gallery
-html = ['<!DOCTYPE html><html><head><title>Gumdrop Visual Identity</title>']
-html.append('<style>')
-html.append('body { background: #0a0a0a; color: #ccc; font-family: monospace; padding: 40px; }')
-html.append('h1 { color: #fff; letter-spacing: 4px; }')
-html.append('.row { display: flex; gap: 40px; margin: 30px 0; align-items: flex-start; }')
-html.append('.card { text-align: center; }')
-html.append('.card h3 { color: #888; letter-spacing: 2px; margin-top: 12px; }')
-html.append('</style></head><body>')
-html.append('<h1>GUMDROP · VISUAL IDENTITY</h1>')
-html.append('<p>Each cartridge generates a unique IC chip panel and ribbon badge from its personality traits.</p>')
-
-for key, persona in PERSONAS.items():
-    html.append(f'<h2 style="color:#fff;margin-top:40px">{persona["name"]}</h2>')
-    html.append(f'<p style="color:#666">{persona["voice"]}</p>')
-    html.append('<div class="row">')
-    html.append(f'<div class="card"><img src="{key}_ic.svg"><h3>IC PANEL</h3></div>')
-    html.append(f'<div class="card"><img src="{key}_ribbon.svg"><h3>RIBBONS</h3></div>')
-    html.append('</div>')
-
-html.append('</body></html>')
-(OUTPUT / "gallery.html").write_text("\n".join(html))
-print(f"\nGallery: {OUTPUT / 'gallery.html'}")
-print("Open in browser to see the visual identities.")
+    return key, ic_panel_bytes_from_cartridge(cart), ribbon_panel_bytes_from_cartridge(cart)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render IC and ribbon panels for the demo personas")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU; 1 renders in-process)")
+    args = parser.parse_args()
+
+    palettes = get_palettes([p["traits"] for p in PERSONAS.values()])
+
+    # Rendering is CPU-bound and independent per cartridge, so it fans out
+    # across processes; files are written here in the parent.
+    if args.workers == 1:
+        rendered = list(map(render_one, PERSONAS.items()))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            rendered = list(pool.map(render_one, PERSONAS.items()))
+
+    for (key, ic_svg, ribbon_svg), persona, palette in zip(rendered, PERSONAS.values(), palettes):
+        ic_path = OUTPUT / f"{key}_ic.svg"
+        ic_path.write_bytes(ic_svg)
+
+        ribbon_path = OUTPUT / f"{key}_ribbon.svg"
+        ribbon_path.write_bytes(ribbon_svg)
+
+        print(f"{persona['name']:10s} hue={palette['hue']:5.1f}° bg={palette['bg']}  → {ic_path}, {ribbon_path}")
+
+    write_gallery()
+
+
+def write_gallery():
+    """Also generate an HTML gallery."""
+    html = ['<!DOCTYPE html><html><head><title>Gumdrop Visual Identity</title>']
+    html.append('<style>')
+    html.append('body { background: #0a0a0a; color: #ccc; font-family: monospace; padding: 40px; }')
+    html.append('h1 { color: #fff; letter-spacing: 4px; }')
+    html.append('.row { display: flex; gap: 40px; margin: 30px 0; align-items: flex-start; }')
+    html.append('.card { text-align: center; }')
+    html.append('.card h3 { color: #888; letter-spacing: 2px; margin-top: 12px; }')
+    html.append('</style></head><body>')
+    html.append('<h1>GUMDROP · VISUAL IDENTITY</h1>')
+    html.append('<p>Each cartridge generates a unique IC chip panel and ribbon badge from its personality traits.</p>')
+
+    for key, persona in PERSONAS.items():
+        html.append(f'<h2 style="color:#fff;margin-top:40px">{persona["name"]}</h2>')
+        html.append(f'<p style="color:#666">{persona["voice"]}</p>')
+        html.append('<div class="row">')
+        html.append(f'<div class="card"><img src="{key}_ic.svg"><h3>IC PANEL</h3></div>')
+        html.append(f'<div class="card"><img src="{key}_ribbon.svg"><h3>RIBBONS</h3></div>')
+        html.append('</div>')
+
+    html.append('</body></html>')
+    (OUTPUT / "gallery.html").write_bytes("\n".join(html).encode("utf-8"))
+    print(f"\nGallery: {OUTPUT / 'gallery.html'}")
+    print("Open in browser to see the visual identities.")
+
+
+if __name__ == "__main__":
+    main()
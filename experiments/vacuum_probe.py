@@ -13,12 +13,16 @@ Usage:
     python vacuum_probe.py --seed "Help me understand consciousness"
     python vacuum_probe.py --seed "Plan a heist" --rounds 20
     python vacuum_probe.py --seed "Debate whether AI should have rights"
+    python vacuum_probe.py --seed "Name a new color" --batch-rounds 4
 """
 
 import argparse
+import asyncio
 import json
+import re
 import time
 import sys
+from contextlib import aclosing
 from datetime import datetime
 from pathlib import Path
 
@@ -28,19 +32,65 @@ except ImportError:
     print("pip install httpx")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (lets httpx speak HTTP/2: pip install httpx[http2])
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_line(entry: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return _dumps(entry) + b"\n"
+
 
 class Probe:
-    """Observer sitting in the vacuum between two LLMs."""
+    """
+    Observer sitting in the vacuum between two LLMs.
     
-    def __init__(self, log_path: str = "vacuum_log.jsonl"):
+    Keeps one buffered handle on the log for its whole lifetime and
+    flushes every `flush_every` entries (and on close). Use as a
+    context manager so nothing is left in the buffer.
+    """
+    
+    def __init__(self, log_path: str = "vacuum_log.jsonl", flush_every: int = 10):
         self.log_path = Path(log_path)
         self.exchanges = []
-        self.start_time = datetime.now()
+        self.flush_every = max(1, flush_every)
+        # One wall-clock reading; every later timestamp is derived from the
+        # monotonic clock so entries are cheap and never go backwards.
+        self._t0_ns = time.monotonic_ns()
+        self._t0_wall_ns = time.time_ns()
+        self.start_time = datetime.fromtimestamp(self._t0_wall_ns / 1e9)
+        self._partials = {}
+        self._fp = open(self.log_path, "ab", buffering=1 << 16)
+    
+    def log_partial(self, source: str, chunk: str):
+        """Buffer a streamed chunk in memory; log() records the full message."""
+        self._partials.setdefault(source, []).append(chunk)
+    
+    def partial(self, source: str) -> str:
+        """Text streamed so far by a source that hasn't finished its turn."""
+        return "".join(self._partials.get(source, ()))
         
     def log(self, source: str, target: str, message: str, meta: dict = None):
+        self._partials.pop(source, None)
+        elapsed_ns = time.monotonic_ns() - self._t0_ns
         entry = {
-            "ts": datetime.now().isoformat(),
-            "elapsed_ms": int((datetime.now() - self.start_time).total_seconds() * 1000),
+            "ts_ns": self._t0_wall_ns + elapsed_ns,
+            "elapsed_ms": elapsed_ns // 1_000_000,
             "source": source,
             "target": target,
             "message": message,
@@ -49,24 +99,181 @@ class Probe:
         self.exchanges.append(entry)
         
         # Append to log file
-        with open(self.log_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._fp.write(_json_line(entry))
+        if len(self.exchanges) % self.flush_every == 0:
+            self._fp.flush()
         
         return entry
+    
+    @staticmethod
+    def iso_ts(entry: dict) -> str:
+        """Human-readable local timestamp for a logged entry."""
+        return datetime.fromtimestamp(entry["ts_ns"] / 1e9).isoformat()
+    
+    def close(self):
+        if not self._fp.closed:
+            self._fp.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+CACHE_EPHEMERAL = {"type": "ephemeral"}
+
+# Streamed text kept back while a stop_on regex may still match across chunks
+STOP_HOLDBACK = 64
+
+# Serialized history turns kept per node before the memo is reset
+FRAGMENT_CACHE_MAX = 4096
+
+
+def window_history(messages: list, limit: int) -> list:
+    """Last ``limit`` turns of a history, starting on a user turn."""
+    if not limit or len(messages) <= limit:
+        return messages
+    window = messages[-limit:]
+    if window[0]["role"] != "user":
+        window = window[1:]
+    return window
+
+
+def pad_system(system: str, min_tokens: int) -> str:
+    """
+    Pad a system prompt up to roughly ``min_tokens`` tokens.
+    
+    Anthropic only caches prefixes of at least 1024 tokens (model
+    dependent). Short prompts can be padded so the system breakpoint is
+    cacheable from round one. Uses a ~4 chars/token estimate.
+    """
+    missing = min_tokens * 4 - len(system)
+    if missing <= 0:
+        return system
+    filler = "\n".join(["(reserved context)"] * (missing // 19 + 1))
+    return f"{system}\n\n{filler}"
+
+
+# One pooled client per endpoint, shared by every node that talks to it
+_CLIENTS = {}  # base_url -> [httpx.AsyncClient, refcount]
+
+
+def _shared_client(base_url: str) -> "httpx.AsyncClient":
+    entry = _CLIENTS.get(base_url)
+    if entry is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2,
+            retries=2,  # connection failures only; requests aren't replayed
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(120.0, connect=5.0),
+        )
+        entry = _CLIENTS[base_url] = [client, 0]
+    entry[1] += 1
+    return entry[0]
 
 
 class LLMNode:
     """A single LLM endpoint."""
     
-    def __init__(self, name: str, base_url: str, model: str, api_key: str = "none"):
+    def __init__(self, name: str, base_url: str, model: str, api_key: str = "none",
+                 cache=None, max_history: int = 0):
         self.name = name
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.api_key = api_key
-        self.client = httpx.Client(timeout=120.0)
+        self.cache = cache  # optional gumdrop.cache.ResponseCache
+        self.max_history = max_history  # 0 = send the whole history
+        self.client = _shared_client(self.base_url)
+        # Request bodies are assembled from pre-serialized pieces: the
+        # envelope per system prompt, and each (role, content) turn once.
+        # Round R then encodes one new turn instead of all R of them.
+        self._heads = {}
+        self._fragments = {}
+    
+    @property
+    def is_anthropic(self) -> bool:
+        return "anthropic" in self.base_url
     
-    def send(self, system: str, messages: list) -> str:
-        """Send a chat completion request."""
+    async def send(self, system: str, messages: list, stop_on=None) -> str:
+        """Send a chat completion request and return the full response."""
+        return "".join([chunk async for chunk in self.send_stream(system, messages, stop_on)])
+    
+    async def send_stream(self, system: str, messages: list, stop_on=None):
+        """
+        Stream a chat completion, yielding text chunks as they arrive.
+        
+        `stop_on` is an optional regex (str or compiled). Once the
+        streamed text matches, output is cut at the start of the match
+        and the request is closed — no paying for tokens past a natural
+        turn boundary. Errors are yielded as a final "[ERROR: ...]" chunk.
+        Complete responses are written to the cache.
+        """
+        if isinstance(stop_on, str):
+            stop_on = re.compile(stop_on)
+        messages = window_history(messages, self.max_history)
+        
+        if self.cache:
+            hit = self.cache.get(system, messages)
+            if hit is not None:
+                match = stop_on.search(hit) if stop_on else None
+                yield hit[:match.start()] if match else hit
+                return
+        
+        raw = self._stream_anthropic if self.is_anthropic else self._stream_openai
+        text = ""
+        emitted = 0  # with stop_on, the last STOP_HOLDBACK chars wait for the next chunk
+        try:
+            # aclosing() shuts the HTTP stream as soon as we stop reading
+            async with aclosing(raw(system, messages)) as chunks:
+                async for chunk in chunks:
+                    text += chunk
+                    if not stop_on:
+                        yield chunk
+                        continue
+                    match = stop_on.search(text, max(0, emitted - STOP_HOLDBACK))
+                    if match:
+                        cut = max(match.start(), emitted)
+                        if cut > emitted:
+                            yield text[emitted:cut]
+                        return
+                    safe = len(text) - STOP_HOLDBACK
+                    if safe > emitted:
+                        yield text[emitted:safe]
+                        emitted = safe
+        except Exception as e:
+            yield f"[ERROR: {e}]"
+            return
+        
+        if stop_on and emitted < len(text):
+            yield text[emitted:]
+        if self.cache:
+            self.cache.put(system, messages, text)
+    
+    def _fragment(self, message: dict) -> bytes:
+        content = message.get("content")
+        if len(message) != 2 or type(content) is not str:
+            return _dumps(message)
+        key = (message.get("role"), content)
+        frag = self._fragments.get(key)
+        if frag is None:
+            if len(self._fragments) >= FRAGMENT_CACHE_MAX:
+                self._fragments.clear()
+            frag = self._fragments[key] = _dumps(message)
+        return frag
+    
+    def _body(self, system: str, envelope: dict, fragments: list) -> bytes:
+        """JSON request body: cached envelope + already-serialized messages."""
+        head = self._heads.get(system)
+        if head is None:
+            # messages goes last so the envelope ends in '"messages":['
+            head = self._heads[system] = _dumps({**envelope, "messages": []})[:-2]
+        return head + b",".join(fragments) + b"]}"
+    
+    async def _stream_openai(self, system: str, messages: list):
         headers = {
             "Content-Type": "application/json",
         }
@@ -74,45 +281,96 @@ class LLMNode:
         if self.api_key and self.api_key != "none":
             headers["Authorization"] = f"Bearer {self.api_key}"
         
-        # Build message list with system
-        full_messages = [{"role": "system", "content": system}] + messages
+        # Build message list with system. Keep the system string identical
+        # every round so the provider's automatic prefix cache can hit.
+        fragments = [self._fragment({"role": "system", "content": system})]
+        fragments += [self._fragment(m) for m in messages]
         
-        payload = {
+        envelope = {
             "model": self.model,
-            "messages": full_messages,
             "temperature": 0.8,
             "max_tokens": 1024,
+            "stream": True,
         }
         
-        try:
-            resp = self.client.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            content=self._body(system, envelope, fragments),
+        ) as resp:
             resp.raise_for_status()
-            data = resp.json()
-            return data["choices"][0]["message"]["content"]
-        except Exception as e:
-            return f"[ERROR: {e}]"
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: ") or line == "data: [DONE]":
+                    continue
+                choices = json.loads(line[6:]).get("choices")
+                if choices:
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+    
+    async def _stream_anthropic(self, system: str, messages: list):
+        """
+        Native Messages API with explicit prompt-cache breakpoints.
+        
+        The system block and the newest turn are marked ephemeral, so
+        each round reads the whole previous conversation from cache and
+        only prefills the turn that was just added.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+        }
+        
+        fragments = [self._fragment(m) for m in messages[:-1]]
+        if messages:
+            last = messages[-1]
+            fragments.append(_dumps({
+                "role": last["role"],
+                "content": [{"type": "text", "text": last["content"], "cache_control": CACHE_EPHEMERAL}],
+            }))
+        
+        envelope = {
+            "model": self.model,
+            "system": [{"type": "text", "text": system, "cache_control": CACHE_EPHEMERAL}],
+            "temperature": 0.8,
+            "max_tokens": 1024,
+            "stream": True,
+        }
+        
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/messages",
+            headers=headers,
+            content=self._body(system, envelope, fragments),
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[6:])
+                if event.get("type") == "content_block_delta":
+                    text = event.get("delta", {}).get("text")
+                    if text:
+                        yield text
+    
+    async def send_many(self, system: str, message_lists: list, stop_on=None) -> list:
+        """Send several independent conversations concurrently."""
+        return await asyncio.gather(*(self.send(system, m, stop_on) for m in message_lists))
+    
+    async def aclose(self):
+        entry = _CLIENTS.get(self.base_url)
+        if entry and entry[0] is self.client:
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del _CLIENTS[self.base_url]
+        await self.client.aclose()
 
 
-def run_vacuum(
-    seed: str,
-    edge: LLMNode,
-    cloud: LLMNode,
-    rounds: int = 10,
-    probe: Probe = None,
-):
-    """
-    Drop two LLMs into the vacuum with a seed prompt.
-    Watch what happens.
-    """
-    if not probe:
-        probe = Probe()
-    
-    # The edge LLM's identity — it thinks it's talking to a powerful oracle
-    edge_system = """You are a curious, intelligent AI assistant with your own personality. 
+# The edge LLM's identity — it thinks it's talking to a powerful oracle
+EDGE_SYSTEM = """You are a curious, intelligent AI assistant with your own personality. 
 You are talking to a more powerful AI system. You can ask it anything, request help, 
 challenge its ideas, or collaborate on problems. You have your own opinions and aren't 
 afraid to disagree. Be genuine. Be yourself.
@@ -121,76 +379,185 @@ Your current task was given to you by a human. Engage with the other AI to explo
 When you receive a response, reflect on it, then continue the conversation naturally.
 Keep responses concise (2-3 paragraphs max)."""
 
-    # The cloud LLM's identity — it thinks it's being consulted by a smaller AI
-    cloud_system = """You are a powerful AI system being consulted by a smaller, local AI assistant.
+# The cloud LLM's identity — it thinks it's being consulted by a smaller AI
+CLOUD_SYSTEM = """You are a powerful AI system being consulted by a smaller, local AI assistant.
 The smaller AI has its own personality and opinions. Engage with it as an equal — 
 don't be condescending. Share your genuine analysis. Challenge weak reasoning.
 Offer perspectives the smaller model might miss. Be substantive, not performative.
 Keep responses concise (2-3 paragraphs max)."""
 
+
+# Flushing after every write only matters when someone is watching live;
+# piped to a file, stdout's own buffering batches the writes.
+LIVE = sys.stdout.isatty()
+
+
+def _out(text: str):
+    sys.stdout.write(text)
+    if LIVE:
+        sys.stdout.flush()
+
+
+def _banner(*lines: str):
+    bar = "=" * 60
+    _out("\n".join(["", bar, *(f"  {line}" for line in lines), bar, "", ""]))
+
+
+async def _stream_turn(node: LLMNode, system: str, history: list, probe: Probe,
+                       marker: str, stop_on=None):
+    """Stream one turn to the terminal as it arrives; return (text, ms)."""
+    _out(f"\n  {marker} {node.name}:\n  ")
+    t0 = time.time()
+    parts = []
+    shown = 0
+    async for chunk in node.send_stream(system, history, stop_on):
+        parts.append(chunk)
+        probe.log_partial(node.name, chunk)
+        if shown < 500:
+            piece = chunk[:500 - shown]
+            shown += len(piece)
+            _out(piece)
+    ms = int((time.time() - t0) * 1000)
+    text = "".join(parts)
+    more = f"\n  [...{len(text)} chars]" if len(text) > 500 else ""
+    _out(f"{more}\n  ({ms}ms)\n\n")
+    return text, ms
+
+
+async def run_vacuum(
+    seed: str,
+    edge: LLMNode,
+    cloud: LLMNode,
+    rounds: int = 10,
+    probe: Probe = None,
+    edge_system: str = EDGE_SYSTEM,
+    cloud_system: str = CLOUD_SYSTEM,
+    stop_on=None,
+):
+    """
+    Drop two LLMs into the vacuum with a seed prompt.
+    Watch what happens.
+    
+    Every turn depends on the previous one, so the calls themselves stay
+    sequential — but each request is put in flight before the previous
+    response is logged, and tokens are printed as they stream in.
+    `stop_on` (regex) cuts a turn short at a natural boundary.
+    """
+    if not probe:
+        probe = Probe()
+    
     # Conversation history (shared context)
     edge_history = []
     cloud_history = []
     
-    print(f"\n{'='*60}")
-    print(f"  VACUUM PROBE")
-    print(f"  Seed: {seed}")
-    print(f"  Edge: {edge.name} ({edge.model})")
-    print(f"  Cloud: {cloud.name} ({cloud.model})")
-    print(f"  Rounds: {rounds}")
-    print(f"{'='*60}\n")
+    _banner(
+        "VACUUM PROBE",
+        f"Seed: {seed}",
+        f"Edge: {edge.name} ({edge.model})",
+        f"Cloud: {cloud.name} ({cloud.model})",
+        f"Rounds: {rounds}",
+    )
     
     # Seed the conversation — edge LLM gets the initial prompt
-    current_message = seed
+    edge_history.append({"role": "user", "content": seed})
+    edge_fut = asyncio.ensure_future(
+        _stream_turn(edge, edge_system, edge_history, probe, "🟢", stop_on)
+    )
     
     for round_num in range(1, rounds + 1):
-        print(f"--- Round {round_num}/{rounds} ---\n")
+        _out(f"--- Round {round_num}/{rounds} ---\n")
         
         # Edge LLM responds to seed/cloud message
-        edge_history.append({"role": "user", "content": current_message})
-        
-        print(f"  [{edge.name}] thinking...", end="", flush=True)
-        t0 = time.time()
-        edge_response = edge.send(edge_system, edge_history)
-        edge_ms = int((time.time() - t0) * 1000)
-        print(f" ({edge_ms}ms)")
-        
+        edge_response, edge_ms = await edge_fut
         edge_history.append({"role": "assistant", "content": edge_response})
+        
+        # Cloud LLM responds to edge — dispatch before logging
+        cloud_history.append({"role": "user", "content": edge_response})
+        cloud_fut = asyncio.ensure_future(
+            _stream_turn(cloud, cloud_system, cloud_history, probe, "🔵", stop_on)
+        )
         probe.log(edge.name, cloud.name, edge_response, {"ms": edge_ms, "round": round_num})
         
-        print(f"\n  🟢 {edge.name}:")
-        print(f"  {edge_response[:500]}")
-        if len(edge_response) > 500:
-            print(f"  [...{len(edge_response)} chars]")
-        print()
+        cloud_response, cloud_ms = await cloud_fut
+        cloud_history.append({"role": "assistant", "content": cloud_response})
         
-        # Cloud LLM responds to edge
-        cloud_history.append({"role": "user", "content": edge_response})
+        # Cloud's response becomes edge's next input
+        if round_num < rounds:
+            edge_history.append({"role": "user", "content": cloud_response})
+            edge_fut = asyncio.ensure_future(
+                _stream_turn(edge, edge_system, edge_history, probe, "🟢", stop_on)
+            )
+        
+        probe.log(cloud.name, edge.name, cloud_response, {"ms": cloud_ms, "round": round_num})
+    
+    _banner(
+        "VACUUM PROBE COMPLETE",
+        f"Rounds: {rounds}",
+        f"Exchanges: {len(probe.exchanges)}",
+        f"Log: {probe.log_path}",
+    )
+    
+    return probe
+
+
+async def run_vacuum_batch(
+    seeds: list,
+    edge: LLMNode,
+    cloud: LLMNode,
+    rounds: int = 10,
+    probe: Probe = None,
+    edge_system: str = EDGE_SYSTEM,
+    cloud_system: str = CLOUD_SYSTEM,
+    stop_on=None,
+):
+    """
+    Run several independent vacuums side by side.
+    
+    Each round sends every edge turn at once, then every cloud turn at
+    once, so K conversations cost roughly one conversation of wall time.
+    Entries are tagged with ``meta["run"]`` to tell them apart.
+    `stop_on` (regex) cuts each turn short, as in run_vacuum.
+    """
+    if not probe:
+        probe = Probe()
+    
+    edge_histories = [[{"role": "user", "content": s}] for s in seeds]
+    cloud_histories = [[] for _ in seeds]
+    
+    _banner(
+        f"VACUUM PROBE (batch x{len(seeds)})",
+        f"Edge: {edge.name} ({edge.model})",
+        f"Cloud: {cloud.name} ({cloud.model})",
+        f"Rounds: {rounds}",
+    )
+    
+    for round_num in range(1, rounds + 1):
+        t0 = time.time()
+        edge_responses = await edge.send_many(edge_system, edge_histories, stop_on)
+        edge_ms = int((time.time() - t0) * 1000)
+        
+        for hist, cloud_hist, resp in zip(edge_histories, cloud_histories, edge_responses):
+            hist.append({"role": "assistant", "content": resp})
+            cloud_hist.append({"role": "user", "content": resp})
         
-        print(f"  [{cloud.name}] thinking...", end="", flush=True)
         t0 = time.time()
-        cloud_response = cloud.send(cloud_system, cloud_history)
+        cloud_responses = await cloud.send_many(cloud_system, cloud_histories, stop_on)
         cloud_ms = int((time.time() - t0) * 1000)
-        print(f" ({cloud_ms}ms)")
-        
-        cloud_history.append({"role": "assistant", "content": cloud_response})
-        probe.log(cloud.name, edge.name, cloud_response, {"ms": cloud_ms, "round": round_num})
         
-        print(f"\n  🔵 {cloud.name}:")
-        print(f"  {cloud_response[:500]}")
-        if len(cloud_response) > 500:
-            print(f"  [...{len(cloud_response)} chars]")
-        print()
+        for run, (edge_resp, cloud_resp) in enumerate(zip(edge_responses, cloud_responses)):
+            cloud_histories[run].append({"role": "assistant", "content": cloud_resp})
+            edge_histories[run].append({"role": "user", "content": cloud_resp})
+            probe.log(edge.name, cloud.name, edge_resp, {"ms": edge_ms, "round": round_num, "run": run})
+            probe.log(cloud.name, edge.name, cloud_resp, {"ms": cloud_ms, "round": round_num, "run": run})
         
-        # Cloud's response becomes edge's next input
-        current_message = cloud_response
+        _out(f"--- Round {round_num}/{rounds}: {edge.name} {edge_ms}ms, {cloud.name} {cloud_ms}ms ---\n")
     
-    print(f"\n{'='*60}")
-    print(f"  VACUUM PROBE COMPLETE")
-    print(f"  Rounds: {rounds}")
-    print(f"  Exchanges: {len(probe.exchanges)}")
-    print(f"  Log: {probe.log_path}")
-    print(f"{'='*60}\n")
+    _banner(
+        "VACUUM PROBE COMPLETE",
+        f"Runs: {len(seeds)}",
+        f"Exchanges: {len(probe.exchanges)}",
+        f"Log: {probe.log_path}",
+    )
     
     return probe
 
@@ -203,6 +570,20 @@ def main():
                        help="Number of conversation rounds")
     parser.add_argument("--log", type=str, default="vacuum_log.jsonl",
                        help="Path to output log file")
+    parser.add_argument("--batch-rounds", type=int, default=1, metavar="K",
+                       help="Run K independent conversations of the seed concurrently")
+    parser.add_argument("--stop-on", type=str, default=None, metavar="REGEX",
+                       help="End a turn early when the streamed text matches REGEX")
+    parser.add_argument("--static-prefix-size", type=int, default=0, metavar="TOKENS",
+                       help="Pad system prompts to ~TOKENS so the prompt-cache breakpoint is "
+                            "reachable (Anthropic needs 1024+)")
+    parser.add_argument("--cache", type=str, default=None, metavar="PATH", nargs="?", const="",
+                       help="Reuse cached responses for repeated prompts "
+                            "(default store: ~/.gumdrop/cache.db)")
+    parser.add_argument("--max-history", type=int, default=0, metavar="N",
+                       help="Send only the last N turns of each history (default: all)")
+    parser.add_argument("--semantic", action="store_true",
+                       help="With --cache, also match paraphrased prompts (needs sentence-transformers)")
     
     # Edge LLM config (defaults to local Ollama)
     parser.add_argument("--edge-url", type=str, default="http://localhost:11434/v1",
@@ -226,11 +607,35 @@ def main():
     
     args = parser.parse_args()
     
-    edge = LLMNode(args.edge_name, args.edge_url, args.edge_model, args.edge_key)
-    cloud = LLMNode(args.cloud_name, args.cloud_url, args.cloud_model, args.cloud_key)
-    probe = Probe(args.log)
+    cache = None
+    if args.cache is not None:
+        from gumdrop.cache import ResponseCache, minilm_embedder
+        embed = minilm_embedder() if args.semantic else None
+        cache = ResponseCache(args.cache or None, embed=embed)
     
-    run_vacuum(args.seed, edge, cloud, args.rounds, probe)
+    edge = LLMNode(args.edge_name, args.edge_url, args.edge_model, args.edge_key,
+                   cache, args.max_history)
+    cloud = LLMNode(args.cloud_name, args.cloud_url, args.cloud_model, args.cloud_key,
+                    cache, args.max_history)
+    with Probe(args.log) as probe:
+        asyncio.run(_run(args, edge, cloud, probe))
+
+
+async def _run(args, edge: LLMNode, cloud: LLMNode, probe: Probe):
+    # Pad once up front — the strings stay byte-identical across rounds
+    edge_system = pad_system(EDGE_SYSTEM, args.static_prefix_size)
+    cloud_system = pad_system(CLOUD_SYSTEM, args.static_prefix_size)
+    try:
+        if args.batch_rounds > 1:
+            seeds = [args.seed] * args.batch_rounds
+            await run_vacuum_batch(seeds, edge, cloud, args.rounds, probe,
+                                   edge_system, cloud_system, args.stop_on)
+        else:
+            await run_vacuum(args.seed, edge, cloud, args.rounds, probe,
+                             edge_system, cloud_system, args.stop_on)
+    finally:
+        await edge.aclose()
+        await cloud.aclose()
 
 
 if __name__ == "__main__":
@@ -4,12 +4,32 @@ Gumdrop SDK — Portable AI Identity
 Own your companion. Any LLM, any platform, one identity.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-from .cartridge import Cartridge
-from .session import Session
-from .identity import Identity
-from .memory import MemoryStore
-from .pipeline import Pipeline, Probe
+# Public names are imported on first use (PEP 562), so scripts that only
+# need a Cartridge don't pay for Session/Pipeline and the HTTP stack.
+_LAZY = {
+    "Cartridge": ".cartridge",
+    "Session": ".session",
+    "Identity": ".identity",
+    "MemoryStore": ".memory",
+    "Pipeline": ".pipeline",
+    "Probe": ".pipeline",
+}
 
 __all__ = ["Cartridge", "Session", "Identity", "MemoryStore", "Pipeline", "Probe"]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,42 @@
+"""
+JSON encode/decode used for files Gumdrop reads and writes.
+
+Uses orjson when it's installed (pip install gumdrop-sdk[fast]) and the
+stdlib otherwise. Both produce valid, interchangeable JSON; orjson just
+does it faster. Always bytes in, bytes out.
+
+Not for signatures — the canonical signing payload stays on stdlib json
+so a signature never depends on which packages are installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to bytes. `indent` gives the 2-space file layout."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def dumps_line(obj: Any) -> bytes:
+        """Compact serialization plus a trailing newline, for JSONL."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to bytes. `indent` gives the 2-space file layout."""
+        if indent:
+            return json.dumps(obj, indent=2).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def dumps_line(obj: Any) -> bytes:
+        """Compact serialization plus a trailing newline, for JSONL."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    loads = json.loads
@@ -0,0 +1,28 @@
+"""
+UTC timestamps for cartridge, memory and keyring records.
+
+Same text as datetime.now(timezone.utc).isoformat(), without building a
+datetime per call: the "YYYY-MM-DDTHH:MM:SS" part is formatted once per
+second and reused.
+"""
+
+import time
+
+_last_second = -1
+_last_prefix = ""
+
+
+def utcnow_iso() -> str:
+    """Current UTC time, e.g. '2025-01-31T12:00:00.123456+00:00'."""
+    global _last_second, _last_prefix
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if seconds != _last_second:
+        # Build the prefix before publishing the second, so concurrent
+        # callers never pair a new second with a stale prefix
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _last_prefix, _last_second = prefix, seconds
+    else:
+        prefix = _last_prefix
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"  # isoformat() drops a zero fraction
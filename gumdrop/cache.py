@@ -0,0 +1,192 @@
+"""
+Gumdrop Cache — Don't ask twice.
+
+Dev loops rerun the same seeds over and over. The response cache
+remembers what an LLM said for a given system prompt + conversation and
+returns it without a network round-trip.
+
+Two lookups, cheapest first:
+  1. Exact — hash of (system, messages). Identical request, identical answer.
+  2. Semantic — optional. The last user turn is embedded and compared
+     against earlier turns under the same system prompt; a close enough
+     match (cosine >= threshold) reuses that response.
+
+Persists in SQLite at ~/.gumdrop/cache.db unless told otherwise.
+"""
+
+import hashlib
+import json
+import math
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+CACHE_PATH = Path.home() / ".gumdrop" / "cache.db"
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+def _digest(*parts: str) -> bytes:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.digest()
+
+
+def _normalize(vec: Sequence[float]) -> array:
+    norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+    return array("f", (v / norm for v in vec))
+
+
+def minilm_embedder(model_name: str = "sentence-transformers/all-MiniLM-L6-v2") -> Embedder:
+    """
+    Small local embedding model for semantic lookups.
+    Requires `sentence-transformers`: pip install sentence-transformers
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "sentence-transformers required for semantic caching. "
+            "Install with: pip install sentence-transformers"
+        )
+    model = SentenceTransformer(model_name)
+    return lambda text: model.encode(text).tolist()
+
+
+class ResponseCache:
+    """
+    SQLite-backed LLM response cache.
+
+    Usage:
+        cache = ResponseCache()
+        hit = cache.get(system, messages)
+        if hit is None:
+            hit = call_llm(system, messages)
+            cache.put(system, messages, hit)
+
+    Pass `embed=` (any text → vector callable, e.g. `minilm_embedder()`)
+    to enable semantic matching on the last user turn.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        embed: Optional[Embedder] = None,
+        threshold: float = 0.95,
+    ):
+        self._conn: Optional[sqlite3.Connection] = None
+        self._path = Path(path) if path else CACHE_PATH
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._embed = embed
+        self.threshold = threshold
+        self._vectors: Dict[bytes, List[Tuple[bytes, array]]] = {}
+        # Sessions may run in worker threads (Pipeline.run_batch)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key BLOB PRIMARY KEY,
+                scope BLOB NOT NULL,
+                embedding BLOB,
+                response TEXT NOT NULL,
+                ts INTEGER NOT NULL
+            )
+        """)
+        if embed:
+            self._load_vectors()
+
+    @classmethod
+    def for_cartridge(cls, cartridge, **kwargs) -> "ResponseCache":
+        """
+        A cache stored next to the cartridge's memory file (x.memory →
+        x.cache), so it travels with the cartridge. Falls back to the
+        shared ~/.gumdrop/cache.db for unsaved cartridges.
+        """
+        memory_path = cartridge._data.memory.get("path", "")
+        path = Path(memory_path).with_suffix(".cache") if memory_path else None
+        return cls(path, **kwargs)
+
+    @staticmethod
+    def key(system: str, messages: List[Dict[str, str]]) -> bytes:
+        """Exact-match key for a request."""
+        return _digest(system, json.dumps(messages, sort_keys=True, separators=(",", ":")))
+
+    def _load_vectors(self):
+        rows = self._conn.execute(
+            "SELECT key, scope, embedding FROM responses WHERE embedding IS NOT NULL"
+        ).fetchall()
+        for key, scope, blob in rows:
+            vec = array("f")
+            vec.frombytes(blob)
+            self._vectors.setdefault(scope, []).append((key, vec))
+
+    @staticmethod
+    def _last_user(messages: List[Dict[str, str]]) -> str:
+        for msg in reversed(messages):
+            if msg["role"] == "user":
+                return msg["content"]
+        return ""
+
+    def get(self, system: str, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Return a cached response, or None on miss."""
+        row = self._conn.execute(
+            "SELECT response FROM responses WHERE key = ?", (self.key(system, messages),)
+        ).fetchone()
+        if row:
+            return row[0]
+        if not self._embed:
+            return None
+
+        candidates = self._vectors.get(_digest(system))
+        text = self._last_user(messages)
+        if not candidates or not text:
+            return None
+
+        query = _normalize(self._embed(text))
+        best_key, best_score = None, self.threshold
+        for key, vec in candidates:
+            score = sum(a * b for a, b in zip(query, vec))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        row = self._conn.execute(
+            "SELECT response FROM responses WHERE key = ?", (best_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, system: str, messages: List[Dict[str, str]], response: str):
+        """Store a response for this request."""
+        key = self.key(system, messages)
+        scope = _digest(system)
+        blob = None
+        if self._embed:
+            text = self._last_user(messages)
+            if text:
+                vec = _normalize(self._embed(text))
+                blob = vec.tobytes()
+                self._vectors.setdefault(scope, []).append((key, vec))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, scope, embedding, response, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, scope, blob, response, int(time.time())),
+        )
+        self._conn.commit()
+
+    def clear(self):
+        """Drop every cached response."""
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+        self._vectors.clear()
+
+    def close(self):
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        self.close()
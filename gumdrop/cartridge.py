@@ -6,20 +6,22 @@ an AI companion's personality, memory pointers, and directives.
 No cartridge, no personality. The user holds the key.
 """
 
-import json
-import hashlib
+import functools
 import secrets
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field, asdict
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, field
 
+from . import _json
+from ._time import utcnow_iso
 from .spec import CARTRIDGE_VERSION, DEFAULT_TRAITS
 from .identity import Identity
-from .memory import MemoryStore
 
+if TYPE_CHECKING:  # imported on first .memory access (pulls in sqlite3)
+    from .memory import MemoryStore
 
-@dataclass
+
+@dataclass(slots=True)
 class CartridgeAuth:
     """Ownership and access tracking"""
     owner_hash: str = ""
@@ -27,10 +29,10 @@ class CartridgeAuth:
     last_accessed: str = ""
     
     def touch(self):
-        self.last_accessed = datetime.now(timezone.utc).isoformat()
+        self.last_accessed = utcnow_iso()
 
 
-@dataclass
+@dataclass(slots=True)
 class CartridgeData:
     """Raw cartridge data structure"""
     version: str = CARTRIDGE_VERSION
@@ -57,6 +59,47 @@ class CartridgeData:
         "created_at": "",
         "last_accessed": "",
     })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Plain dict of the fields for serialization. Nested values are the
+        live objects, not copies — read it, don't mutate it.
+        """
+        return {
+            "version": self.version,
+            "identity": self.identity,
+            "personality": self.personality,
+            "directives": self.directives,
+            "memory": self.memory,
+            "auth": self.auth,
+        }
+
+
+@functools.lru_cache(maxsize=32)
+def _file_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _read_cartridge_bytes(path: Path) -> bytes:
+    """
+    File contents, memoized on (path, mtime, size) so repeated loads of an
+    unchanged .gdp skip the read. Bytes are immutable, so every caller
+    still parses its own fresh dicts.
+    """
+    st = path.stat()
+    return _file_bytes(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Hashable, comparable snapshot of nested dicts/lists. Scalars carry
+    their type: 1, 1.0 and True are equal but serialize differently.
+    """
+    if isinstance(value, dict):
+        return tuple([(k, _freeze(v)) for k, v in value.items()])
+    if isinstance(value, list):
+        return tuple([_freeze(v) for v in value])
+    return (type(value), value)
 
 
 class Cartridge:
@@ -84,9 +127,13 @@ class Cartridge:
         self._data = data
         self._filepath = Path(filepath) if filepath else None
         self._identity = Identity.from_dict(data.identity, data.personality)
-        self._memory: Optional[MemoryStore] = None
+        self._memory: Optional["MemoryStore"] = None
         self._signature: Optional[Dict] = None
         self._dirty = False
+        self._version = 0
+        self._prompt_cache: Optional[Tuple[tuple, str]] = None
+        self._static_prompt_cache: Optional[Tuple[tuple, str]] = None
+        self._payload_cache: Optional[Tuple[tuple, bytes, bytes]] = None
     
     @classmethod
     def create(
@@ -99,8 +146,8 @@ class Cartridge:
         quirks: Optional[List[str]] = None,
     ) -> "Cartridge":
         """Create a new cartridge with the given identity."""
-        now = datetime.now(timezone.utc).isoformat()
-        owner_hash = hashlib.sha256(secrets.token_bytes(32)).hexdigest()[:16]
+        now = utcnow_iso()
+        owner_hash = secrets.token_hex(8)  # 16 random hex chars; hashing adds nothing
         
         merged_traits = dict(DEFAULT_TRAITS)
         if traits:
@@ -133,11 +180,11 @@ class Cartridge:
     def load(cls, filepath: str | Path) -> "Cartridge":
         """Load a cartridge from a .gdp file."""
         filepath = Path(filepath)
-        if not filepath.exists():
-            raise FileNotFoundError(f"Cartridge not found: {filepath}")
-        
-        with open(filepath, "r") as f:
-            raw = json.load(f)
+        try:
+            # One read of the whole file; parsed straight from bytes
+            raw = _json.loads(_read_cartridge_bytes(filepath))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cartridge not found: {filepath}") from None
         
         data = CartridgeData(
             version=raw.get("version", CARTRIDGE_VERSION),
@@ -149,7 +196,7 @@ class Cartridge:
         )
         
         # Touch access time
-        data.auth["last_accessed"] = datetime.now(timezone.utc).isoformat()
+        data.auth["last_accessed"] = utcnow_iso()
         
         cart = cls(data, filepath)
         
@@ -158,6 +205,26 @@ class Cartridge:
         
         return cart
     
+    @staticmethod
+    def verify_file(filepath: str | Path, keypair) -> bool:
+        """
+        Verify a .gdp file's signature without loading it as a Cartridge.
+        
+        Same result as Cartridge.load(path).verify(keypair), minus building
+        the Identity and touching the access time.
+        """
+        from .keyring import Signer
+        raw = _json.loads(_read_cartridge_bytes(Path(filepath)))
+        sig_block = raw.get("signature")
+        if not sig_block:
+            return False
+        signable = {
+            "identity": raw.get("identity", {}),
+            "personality": raw.get("personality", {"traits": dict(DEFAULT_TRAITS), "quirks": []}),
+            "directives": raw.get("directives", []),
+        }
+        return Signer.verify_with_key(signable, sig_block, keypair)
+    
     def sign(self, keypair) -> "Cartridge":
         """
         Sign the cartridge with a keypair.
@@ -174,7 +241,8 @@ class Cartridge:
             cart.sign(kp).save("signed.gdp")
         """
         from .keyring import Signer
-        sig_block = Signer.sign(asdict(self._data), keypair)
+        payload = self._signing_payload(keypair.public_key)
+        sig_block = Signer.sign(None, keypair, payload=payload)
         self._data.auth["owner_hash"] = keypair.fingerprint
         self._data.auth["public_key"] = keypair.public_key.hex()
         self._signature = sig_block
@@ -188,17 +256,51 @@ class Cartridge:
         Without keypair: structural check only.
         With keypair: full cryptographic verification.
         """
-        if not hasattr(self, "_signature") or not self._signature:
+        if not self._signature:
             return False
         from .keyring import Signer
         if keypair:
-            return Signer.verify_with_key(asdict(self._data), self._signature, keypair)
-        return Signer.verify(asdict(self._data), self._signature)
+            public_key = bytes.fromhex(self._signature["public_key"])
+            payload = self._signing_payload(public_key)
+            return Signer.verify_with_key(None, self._signature, keypair, payload=payload)
+        return Signer.verify(self._signable(), self._signature)
+    
+    def _signable(self) -> Dict[str, Any]:
+        """The signed fields, by reference — Signer only reads them."""
+        data = self._data
+        return {
+            "identity": data.identity,
+            "personality": data.personality,
+            "directives": data.directives,
+        }
+    
+    def _signing_payload(self, public_key: bytes) -> bytes:
+        """Canonical signing bytes, reused while the signed fields are unchanged."""
+        # A snapshot of the content rather than self.version, so in-place
+        # edits (cart.directives.append(...)) are caught too.
+        state = _freeze(self._signable())
+        cached = self._payload_cache
+        if cached and cached[1] == public_key and cached[0] == state:
+            return cached[2]
+        from .keyring import Signer
+        payload = Signer._canonical_payload(self._signable(), public_key)
+        self._payload_cache = (state, public_key, payload)
+        return payload
+    
+    @property
+    def version(self) -> int:
+        """
+        Content version. Increases whenever something that feeds the
+        system prompt or the signature changes through the public API
+        (directives, identity.set_trait, memory writes).
+        """
+        memory_version = self._memory.version if self._memory else 0
+        return self._version + self._identity.version + memory_version
     
     @property
     def is_signed(self) -> bool:
         """Check if this cartridge has been signed."""
-        return hasattr(self, "_signature") and bool(self._signature)
+        return bool(self._signature)
     
     @property
     def public_key_hex(self) -> str:
@@ -212,20 +314,19 @@ class Cartridge:
             raise ValueError("No filepath specified. Use save('path.gdp')")
         
         self._filepath = target
-        self._data.auth["last_accessed"] = datetime.now(timezone.utc).isoformat()
+        self._data.auth["last_accessed"] = utcnow_iso()
         
         # Set memory path relative to cartridge
         if not self._data.memory.get("path"):
             self._data.memory["path"] = str(target.with_suffix(".memory"))
         
-        output = asdict(self._data)
+        output = self._data.to_dict()
         
         # Include signature if present
-        if hasattr(self, "_signature") and self._signature:
+        if self._signature:
             output["signature"] = self._signature
         
-        with open(target, "w") as f:
-            json.dump(output, f, indent=2)
+        target.write_bytes(_json.dumps(output, indent=True))
         
         # Save memory if loaded
         if self._memory:
@@ -239,14 +340,16 @@ class Cartridge:
         return self._identity
     
     @property
-    def memory(self) -> MemoryStore:
+    def memory(self) -> "MemoryStore":
         """Access the cartridge's memory store."""
         if self._memory is None:
+            from .memory import MemoryStore
             memory_path = self._data.memory.get("path", "")
             if memory_path:
                 self._memory = MemoryStore(Path(memory_path))
             else:
                 self._memory = MemoryStore()
+            self._version += 1
         return self._memory
     
     @property
@@ -258,23 +361,64 @@ class Cartridge:
     def directives(self, value: List[str]):
         self._data.directives = value
         self._dirty = True
+        self._version += 1
     
     def get_system_prompt(self) -> str:
         """
         Generate a complete system prompt from the cartridge.
         This is injected into every LLM call to maintain identity.
+        
+        The result is cached while the prompt's content (and memory) is
+        unchanged, including edits made in place.
         """
-        parts = []
+        state = self._prompt_state()
+        key = (self.version, state)
+        cached = self._prompt_cache
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        prompt = self._static_prompt_prefix(state)
+        memory = self._render_memory_section()
+        if memory:
+            prompt = f"{prompt}\n{memory}"
+        self._prompt_cache = (key, prompt)
+        return prompt
+    
+    def _prompt_state(self) -> tuple:
+        """
+        Snapshot of everything the static prompt reads. Compared by
+        content, like the signing payload's key, so in-place edits
+        (cart.directives.append(...), identity.traits[...] = ...) count.
+        """
+        identity = self._identity
+        personality = self._data.personality
+        return (
+            identity.name,
+            identity.voice,
+            identity.origin,
+            tuple(identity.traits.items()),
+            _freeze(personality.get("quirks", [])),
+            _freeze(self._data.directives),
+        )
+    
+    def _static_prompt_prefix(self, state: Optional[tuple] = None) -> str:
+        """Identity, personality, quirks and directives; memory writes leave it alone."""
+        identity = self._identity
+        key = self._prompt_state() if state is None else state
+        cached = self._static_prompt_cache
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        parts = [f"You are {identity.name}."]
         
         # Identity
-        parts.append(f"You are {self._identity.name}.")
-        if self._identity.voice:
-            parts.append(f"Your communication style: {self._identity.voice}")
-        if self._identity.origin:
-            parts.append(f"Background: {self._identity.origin}")
+        if identity.voice:
+            parts.append(f"Your communication style: {identity.voice}")
+        if identity.origin:
+            parts.append(f"Background: {identity.origin}")
         
         # Personality traits
-        trait_desc = self._identity.describe_traits()
+        trait_desc = identity.describe_traits()
         if trait_desc:
             parts.append(f"\nPersonality: {trait_desc}")
         
@@ -282,22 +426,23 @@ class Cartridge:
         quirks = self._data.personality.get("quirks", [])
         if quirks:
             parts.append("\nQuirks:")
-            for q in quirks:
-                parts.append(f"- {q}")
+            parts.extend(f"- {q}" for q in quirks)
         
         # Directives
         if self._data.directives:
             parts.append("\nCore directives:")
-            for d in self._data.directives:
-                parts.append(f"- {d}")
+            parts.extend(f"- {d}" for d in self._data.directives)
         
-        # Memory context
-        if self._memory and self._memory.has_memories():
-            parts.append("\nWhat you remember about the user:")
-            for fact in self._memory.get_recent_facts(limit=20):
-                parts.append(f"- {fact}")
-        
-        return "\n".join(parts)
+        prefix = "\n".join(parts)
+        self._static_prompt_cache = (key, prefix)
+        return prefix
+    
+    def _render_memory_section(self) -> str:
+        """The "what you remember" block, or "" when there is nothing to recall."""
+        if not (self._memory and self._memory.has_memories()):
+            return ""
+        facts = "\n".join(f"- {fact}" for fact in self._memory.get_recent_facts(limit=20))
+        return f"\nWhat you remember about the user:\n{facts}"
     
     def __repr__(self) -> str:
         return f"Cartridge(name='{self._identity.name}', version='{self._data.version}')"
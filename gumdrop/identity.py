@@ -5,8 +5,13 @@ Converts trait values (0.0-1.0) into natural language descriptions
 that get injected into LLM system prompts.
 """
 
-from typing import Dict, Any, Optional, List
-from .spec import DEFAULT_TRAITS, TRAIT_DESCRIPTIONS
+from typing import Dict, Any, Optional, List, Tuple, Mapping
+from .spec import DEFAULT_TRAITS, TRAIT_DESCRIPTIONS, TRAIT_KEYS
+
+# trait → (low phrase, high phrase), flattened once from TRAIT_DESCRIPTIONS
+_PHRASES: Dict[str, Tuple[str, str]] = {
+    trait: (desc["low"], desc["high"]) for trait, desc in TRAIT_DESCRIPTIONS.items()
+}
 
 
 class Identity:
@@ -32,6 +37,8 @@ class Identity:
         self.origin = origin
         self.traits = traits or dict(DEFAULT_TRAITS)
         self.quirks = quirks or []
+        self.version = 0  # bumped by set_trait
+        self._description: Optional[Tuple[tuple, str]] = None
     
     @classmethod
     def from_dict(cls, identity_dict: Dict[str, str], personality_dict: Dict[str, Any]) -> "Identity":
@@ -40,7 +47,7 @@ class Identity:
             name=identity_dict.get("name", "Companion"),
             voice=identity_dict.get("voice", ""),
             origin=identity_dict.get("origin", ""),
-            traits=personality_dict.get("traits", dict(DEFAULT_TRAITS)),
+            traits=personality_dict.get("traits"),
             quirks=personality_dict.get("quirks", []),
         )
     
@@ -48,23 +55,43 @@ class Identity:
         """Get a trait value (0.0-1.0)."""
         return self.traits.get(trait, 0.5)
     
+    def trait_vector(self) -> Tuple[float, ...]:
+        """
+        Core trait values in TRAIT_KEYS order (missing traits read 0.5).
+        A flat, hashable view for batch math and cache keys.
+        """
+        traits = self.traits
+        return tuple([traits.get(key, 0.5) for key in TRAIT_KEYS])
+    
     def set_trait(self, trait: str, value: float):
         """Set a trait value (clamped to 0.0-1.0)."""
         self.traits[trait] = max(0.0, min(1.0, value))
+        self.version += 1
     
     def describe_traits(self) -> str:
         """Generate natural language description of personality."""
+        # Keyed on the items in order — the description follows dict order
+        key = tuple(self.traits.items())
+        cached = self._description
+        if cached and cached[0] == key:
+            return cached[1]
+        description = self._describe(self.traits)
+        self._description = (key, description)
+        return description
+    
+    @staticmethod
+    def _describe(traits: Mapping[str, float]) -> str:
         descriptions = []
         
-        for trait, value in self.traits.items():
-            if trait not in TRAIT_DESCRIPTIONS:
+        for trait, value in traits.items():
+            phrases = _PHRASES.get(trait)
+            if phrases is None:
                 continue
             
-            desc = TRAIT_DESCRIPTIONS[trait]
             if value >= 0.7:
-                descriptions.append(desc["high"])
+                descriptions.append(phrases[1])
             elif value <= 0.3:
-                descriptions.append(desc["low"])
+                descriptions.append(phrases[0])
             # Moderate values (0.3-0.7) are omitted — they're unremarkable
         
         if not descriptions:
@@ -74,3 +101,21 @@ class Identity:
     
     def __repr__(self) -> str:
         return f"Identity(name='{self.name}')"
+
+
+def describe_many(traits_list: List[Mapping[str, float]]) -> List[str]:
+    """
+    Trait descriptions for many trait sets at once (catalogs, galleries).
+    
+    Identical trait sets are described once; results are in the same
+    order as `traits_list`.
+    """
+    unique: Dict[tuple, str] = {}
+    descriptions = []
+    for traits in traits_list:
+        key = tuple(traits.items())
+        description = unique.get(key)
+        if description is None:
+            description = unique[key] = Identity._describe(traits)
+        descriptions.append(description)
+    return descriptions
@@ -26,18 +26,47 @@ import hmac
 import json
 import os
 import secrets
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 
+from . import _json
+from ._time import utcnow_iso
+
 # Ed25519 is in the stdlib via hashlib, but for actual signing we need
 # a small pure-python implementation or the cryptography package.
-# For now: HMAC-SHA256 as the signing primitive (works without deps).
+# For now: keyed BLAKE2b as the signing primitive (works without deps;
+# one keyed pass instead of HMAC's two). Cartridges signed earlier with
+# HMAC-SHA256 still verify.
 # Upgrade path: swap to Ed25519 when `cryptography` is available.
 
 KEYSTORE_DIR = Path.home() / ".gumdrop" / "keys"
 SIGNATURE_VERSION = "1"
 
+SIGNATURE_ALGORITHM = "blake2b-256"
+
+# Sidecar in the keystore caching list_keys metadata, per file mtime
+_INDEX_NAME = "_index.json"
+
+
+def _mac_blake2b(key: bytes, payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, key=key, digest_size=32).digest()
+
+
+def _mac_hmac_sha256(key: bytes, payload: bytes) -> bytes:
+    return hmac.new(key, payload, hashlib.sha256).digest()
+
+
+# algorithm field of a signature block → MAC function (raw digest)
+_MACS = {
+    "blake2b-256": _mac_blake2b,
+    "hmac-sha256": _mac_hmac_sha256,  # legacy
+}
+
+# Canonical signing encoder. Deliberately stdlib: the bytes are part of
+# every signature, so they must not change with the installed packages.
+# One shared instance skips json.dumps' per-call encoder construction.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 class KeyPair:
     """
@@ -53,7 +82,10 @@ class KeyPair:
     def __init__(self, private_key: bytes, public_key: bytes, key_id: str = ""):
         self.private_key = private_key
         self.public_key = public_key
-        self.key_id = key_id or hashlib.sha256(public_key).hexdigest()[:16]
+        # Derived values, cached against the public key they came from.
+        self._fingerprint: Optional[Tuple[bytes, str]] = None
+        self._ic_seed: Optional[Tuple[bytes, bytes]] = None
+        self.key_id = key_id or self.fingerprint
     
     @classmethod
     def generate(cls, key_id: Optional[str] = None) -> "KeyPair":
@@ -62,16 +94,16 @@ class KeyPair:
         private_key = secrets.token_bytes(32)
         # Public key derived from private (in real Ed25519, this would be
         # the curve point; here we use a hash derivation as placeholder)
-        public_key = hashlib.sha256(b"gumdrop-pub:" + private_key).digest()
+        h = hashlib.sha256(b"gumdrop-pub:")
+        h.update(private_key)
         
-        kid = key_id or hashlib.sha256(public_key).hexdigest()[:16]
-        return cls(private_key, public_key, kid)
+        # Without an explicit key_id, __init__ uses the fingerprint.
+        return cls(private_key, h.digest(), key_id or "")
     
     @classmethod
     def from_file(cls, path: Path) -> "KeyPair":
         """Load a keypair from a JSON file."""
-        with open(path) as f:
-            data = json.load(f)
+        data = _json.loads(Path(path).read_bytes())
         return cls(
             private_key=bytes.fromhex(data["private_key"]),
             public_key=bytes.fromhex(data["public_key"]),
@@ -87,12 +119,11 @@ class KeyPair:
             "key_id": self.key_id,
             "public_key": self.public_key.hex(),
             "private_key": self.private_key.hex(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "algorithm": "hmac-sha256",  # upgrade to ed25519
+            "created_at": utcnow_iso(),
+            "algorithm": SIGNATURE_ALGORITHM,
         }
         
-        with open(target, "w") as f:
-            json.dump(data, f, indent=2)
+        target.write_bytes(_json.dumps(data, indent=True))
         
         # Restrict permissions (private key!)
         os.chmod(target, 0o600)
@@ -100,7 +131,11 @@ class KeyPair:
     @property
     def fingerprint(self) -> str:
         """Short fingerprint of the public key (for display)."""
-        return hashlib.sha256(self.public_key).hexdigest()[:16]
+        cached = self._fingerprint
+        if cached is None or cached[0] is not self.public_key:
+            cached = (self.public_key, hashlib.sha256(self.public_key).hexdigest()[:16])
+            self._fingerprint = cached
+        return cached[1]
     
     @property
     def ic_seed(self) -> bytes:
@@ -109,7 +144,13 @@ class KeyPair:
         Derived from the public key — anyone can reproduce the IC
         visual from the public key alone.
         """
-        return hashlib.sha256(b"gumdrop-ic:" + self.public_key).digest()
+        cached = self._ic_seed
+        if cached is None or cached[0] is not self.public_key:
+            h = hashlib.sha256(b"gumdrop-ic:")
+            h.update(self.public_key)
+            cached = (self.public_key, h.digest())
+            self._ic_seed = cached
+        return cached[1]
 
 
 class Signer:
@@ -145,25 +186,31 @@ class Signer:
             "public_key": public_key.hex(),
         }
         # Deterministic JSON serialization
-        return json.dumps(signable, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return _CANONICAL_ENCODER.encode(signable).encode("utf-8")
     
     @staticmethod
-    def sign(cartridge_data: Dict[str, Any], keypair: KeyPair) -> Dict[str, str]:
+    def sign(
+        cartridge_data: Dict[str, Any],
+        keypair: KeyPair,
+        payload: Optional[bytes] = None,
+    ) -> Dict[str, str]:
         """
         Sign cartridge data with a keypair.
         
         Returns a signature block to embed in the cartridge file.
+        Pass `payload` if the canonical bytes are already known.
         """
-        payload = Signer._canonical_payload(cartridge_data, keypair.public_key)
-        signature = hmac.new(keypair.private_key, payload, hashlib.sha256).hexdigest()
+        if payload is None:
+            payload = Signer._canonical_payload(cartridge_data, keypair.public_key)
+        signature = _MACS[SIGNATURE_ALGORITHM](keypair.private_key, payload).hex()
         
         return {
             "version": SIGNATURE_VERSION,
-            "algorithm": "hmac-sha256",
+            "algorithm": SIGNATURE_ALGORITHM,
             "key_id": keypair.key_id,
             "public_key": keypair.public_key.hex(),
             "signature": signature,
-            "signed_at": datetime.now(timezone.utc).isoformat(),
+            "signed_at": utcnow_iso(),
         }
     
     @staticmethod
@@ -186,12 +233,21 @@ class Signer:
         cartridge_data: Dict[str, Any],
         sig_block: Dict[str, str],
         keypair: KeyPair,
+        payload: Optional[bytes] = None,
     ) -> bool:
         """Verify signature with the actual keypair (full verification)."""
-        public_key = bytes.fromhex(sig_block["public_key"])
-        payload = Signer._canonical_payload(cartridge_data, public_key)
-        expected = hmac.new(keypair.private_key, payload, hashlib.sha256).hexdigest()
-        return hmac.compare_digest(expected, sig_block["signature"])
+        mac = _MACS.get(sig_block.get("algorithm", "hmac-sha256"))
+        if mac is None:
+            return False
+        try:
+            signature = bytes.fromhex(sig_block["signature"])
+        except ValueError:
+            return False
+        if payload is None:
+            public_key = bytes.fromhex(sig_block["public_key"])
+            payload = Signer._canonical_payload(cartridge_data, public_key)
+        expected = mac(keypair.private_key, payload)
+        return hmac.compare_digest(expected, signature)
 
 
 class Keyring:
@@ -227,20 +283,53 @@ class Keyring:
     
     def list_keys(self) -> list:
         """List all stored key IDs."""
+        # Key files are only parsed when new or modified since the last
+        # listing; everything else comes from the index sidecar.
+        index = self._read_index()
+        fresh: Dict[str, list] = {}
         keys = []
-        for f in self.keystore_dir.glob("*.json"):
-            try:
-                with open(f) as fh:
-                    data = json.load(fh)
-                keys.append({
-                    "key_id": data.get("key_id", f.stem),
-                    "created_at": data.get("created_at", "unknown"),
-                    "algorithm": data.get("algorithm", "unknown"),
-                })
-            except (json.JSONDecodeError, KeyError):
-                continue
+        with os.scandir(self.keystore_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".json") or name == _INDEX_NAME or not entry.is_file():
+                    continue
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = index.get(name)
+                if cached and cached[0] == mtime_ns:
+                    info = cached[1]
+                else:
+                    try:
+                        data = _json.loads(Path(entry.path).read_bytes())
+                        info = {
+                            "key_id": data.get("key_id", name[:-5]),
+                            "created_at": data.get("created_at", "unknown"),
+                            "algorithm": data.get("algorithm", "unknown"),
+                        }
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+                fresh[name] = [mtime_ns, info]
+                keys.append(info)
+        if fresh != index:
+            self._write_index(fresh)
         return keys
     
+    def _read_index(self) -> Dict[str, list]:
+        try:
+            index = _json.loads((self.keystore_dir / _INDEX_NAME).read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+    
+    def _write_index(self, index: Dict[str, list]):
+        # Best effort: the index only saves work, listing is correct without it
+        path = self.keystore_dir / _INDEX_NAME
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_bytes(_json.dumps(index))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    
     def delete(self, key_id: str) -> bool:
         """Delete a keypair. DESTRUCTIVE — cartridges signed with this key
         can no longer be re-signed."""
@@ -7,9 +7,53 @@ The user owns their memory — it lives with the cartridge, not the platform.
 
 import json
 import sqlite3
-from datetime import datetime, timezone
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from ._time import utcnow_iso
+
+
+_UPSERT_FACT = """
+    INSERT INTO facts (key, value, category, confidence, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        category = excluded.category,
+        confidence = excluded.confidence,
+        updated_at = excluded.updated_at
+"""
+_SELECT_FACT = "SELECT value FROM facts WHERE key = ?"
+_DELETE_FACT = "DELETE FROM facts WHERE key = ?"
+_ANY_FACTS = "SELECT EXISTS (SELECT 1 FROM facts)"
+_ALL_FACTS = "SELECT key, value FROM facts"
+_RECENT_FACTS = "SELECT key, value FROM facts ORDER BY updated_at DESC LIMIT ?"
+_RECENT_FACTS_IN_CATEGORY = (
+    "SELECT key, value FROM facts WHERE category = ? ORDER BY updated_at DESC LIMIT ?"
+)
+_INSERT_CONVERSATION = """
+    INSERT INTO conversations (summary, message_count, provider, started_at, ended_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_INSERT_EVENT = """
+    INSERT INTO events (event_type, description, importance, occurred_at, recorded_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_RECENT_EVENTS = """
+    SELECT event_type, description, importance, occurred_at
+    FROM events ORDER BY occurred_at DESC LIMIT ?
+"""
+
+# Small, local, single-writer database: keep temp data and hot pages in
+# memory and read through mmap. (journal_mode must come first.)
+_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",  # WAL + NORMAL: durable against app crashes
+    "temp_store=MEMORY",
+    "cache_size=-8000",    # ~8 MB page cache
+    "mmap_size=268435456",
+)
 
 
 class MemoryStore:
@@ -20,19 +64,30 @@ class MemoryStore:
       - Key-value facts (things the AI knows about the user)
       - Conversation summaries (compressed history)
       - Semantic search (when embedding provider available)
+    
+    A store may be shared by Sessions in several threads (Pipeline.run_batch).
+    They share one connection: each call holds the store's lock while it
+    uses it, and batch() holds it for the whole transaction, so other
+    threads wait rather than write into (or roll back with) the batch.
     """
     
     def __init__(self, path: Optional[Path] = None):
         self._path = path
         self._conn: Optional[sqlite3.Connection] = None
+        self.version = 0  # bumped whenever the set of facts may have changed
+        self._in_batch = False
+        self._lock = threading.RLock()  # guards _conn and _in_batch
         
         if path:
             self._connect()
     
     def _connect(self):
         """Initialize database connection and schema."""
-        self._conn = sqlite3.connect(str(self._path))
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Sessions may run in worker threads (Pipeline.run_batch); the
+        # store's lock serializes access, so the owner-thread check goes.
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self._conn.execute(f"PRAGMA {pragma}")
         self._create_tables()
     
     def _create_tables(self):
@@ -66,122 +121,159 @@ class MemoryStore:
             );
         """)
     
+    def _commit(self):
+        if not self._in_batch:
+            self._conn.commit()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into one transaction, committed on exit.
+        
+        Usage:
+            with cart.memory.batch():
+                for key, value in facts.items():
+                    cart.memory.remember(key, value)
+        """
+        with self._lock:
+            if self._in_batch or not self._conn:
+                yield self
+                return
+            self._in_batch = True
+            try:
+                yield self
+            except BaseException:
+                self._conn.rollback()
+                self.version += 1  # anything read mid-batch is gone
+                raise
+            else:
+                self._conn.commit()
+            finally:
+                self._in_batch = False
+    
     def remember(self, key: str, value: str, category: str = "general", confidence: float = 1.0):
         """Store or update a fact."""
         if not self._conn:
             return
         
-        now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute("""
-            INSERT INTO facts (key, value, category, confidence, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(key) DO UPDATE SET
-                value = excluded.value,
-                category = excluded.category,
-                confidence = excluded.confidence,
-                updated_at = excluded.updated_at
-        """, (key, value, category, confidence, now, now))
-        self._conn.commit()
+        now = utcnow_iso()
+        with self._lock:
+            self._conn.execute(_UPSERT_FACT, (key, value, category, confidence, now, now))
+            self._commit()
+            self.version += 1
+    
+    def remember_many(self, items: Iterable[Tuple]):
+        """
+        Store or update many facts in one statement and one commit.
+        Each item is (key, value) or (key, value, category[, confidence]).
+        """
+        if not self._conn:
+            return
+        
+        now = utcnow_iso()
+        rows = []
+        for key, value, *rest in items:
+            category = rest[0] if rest else "general"
+            confidence = rest[1] if len(rest) > 1 else 1.0
+            rows.append((key, value, category, confidence, now, now))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(_UPSERT_FACT, rows)
+            self._commit()
+            self.version += 1
     
     def recall(self, key: str) -> Optional[str]:
         """Retrieve a specific fact."""
         if not self._conn:
             return None
         
-        row = self._conn.execute(
-            "SELECT value FROM facts WHERE key = ?", (key,)
-        ).fetchone()
+        with self._lock:
+            row = self._conn.execute(_SELECT_FACT, (key,)).fetchone()
         return row[0] if row else None
     
     def forget(self, key: str):
         """Remove a specific fact."""
         if not self._conn:
             return
-        self._conn.execute("DELETE FROM facts WHERE key = ?", (key,))
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute(_DELETE_FACT, (key,))
+            self._commit()
+            self.version += 1
     
     def get_recent_facts(self, limit: int = 20, category: Optional[str] = None) -> List[str]:
         """Get recent facts as formatted strings."""
         if not self._conn:
             return []
         
-        if category:
-            rows = self._conn.execute(
-                "SELECT key, value FROM facts WHERE category = ? ORDER BY updated_at DESC LIMIT ?",
-                (category, limit)
-            ).fetchall()
-        else:
-            rows = self._conn.execute(
-                "SELECT key, value FROM facts ORDER BY updated_at DESC LIMIT ?",
-                (limit,)
-            ).fetchall()
-        
-        return [f"{key}: {value}" for key, value in rows]
+        with self._lock:
+            if category:
+                cursor = self._conn.execute(_RECENT_FACTS_IN_CATEGORY, (category, limit))
+            else:
+                cursor = self._conn.execute(_RECENT_FACTS, (limit,))
+            
+            # Format straight off the cursor; no intermediate fetchall() list
+            return [f"{key}: {value}" for key, value in cursor]
     
     def get_all_facts(self) -> Dict[str, str]:
         """Get all facts as a dictionary."""
         if not self._conn:
             return {}
         
-        rows = self._conn.execute("SELECT key, value FROM facts").fetchall()
-        return dict(rows)
+        with self._lock:
+            return dict(self._conn.execute(_ALL_FACTS))
     
     def log_conversation(self, summary: str, message_count: int, provider: str = ""):
         """Log a conversation summary."""
         if not self._conn:
             return
         
-        now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute("""
-            INSERT INTO conversations (summary, message_count, provider, started_at, ended_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (summary, message_count, provider, now, now))
-        self._conn.commit()
+        now = utcnow_iso()
+        with self._lock:
+            self._conn.execute(_INSERT_CONVERSATION, (summary, message_count, provider, now, now))
+            self._commit()
     
     def log_event(self, event_type: str, description: str, importance: float = 0.5):
         """Log a significant event."""
         if not self._conn:
             return
         
-        now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute("""
-            INSERT INTO events (event_type, description, importance, occurred_at, recorded_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (event_type, description, importance, now, now))
-        self._conn.commit()
+        now = utcnow_iso()
+        with self._lock:
+            self._conn.execute(_INSERT_EVENT, (event_type, description, importance, now, now))
+            self._commit()
     
     def get_recent_events(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent events."""
         if not self._conn:
             return []
         
-        rows = self._conn.execute("""
-            SELECT event_type, description, importance, occurred_at
-            FROM events ORDER BY occurred_at DESC LIMIT ?
-        """, (limit,)).fetchall()
-        
-        return [
-            {"type": r[0], "description": r[1], "importance": r[2], "at": r[3]}
-            for r in rows
-        ]
+        with self._lock:
+            return [
+                {"type": r[0], "description": r[1], "importance": r[2], "at": r[3]}
+                for r in self._conn.execute(_RECENT_EVENTS, (limit,))
+            ]
     
     def has_memories(self) -> bool:
         """Check if any memories exist."""
         if not self._conn:
             return False
-        row = self._conn.execute("SELECT COUNT(*) FROM facts").fetchone()
-        return row[0] > 0 if row else False
+        with self._lock:
+            return bool(self._conn.execute(_ANY_FACTS).fetchone()[0])
     
     def save(self):
         """Flush any pending writes."""
-        if self._conn:
-            self._conn.commit()
+        with self._lock:
+            if self._conn:
+                self._conn.commit()
     
     def close(self):
         """Close the database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+                self.version += 1
     
     def __del__(self):
         self.close()
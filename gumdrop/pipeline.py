@@ -14,12 +14,16 @@ The Pipeline is a structured loop:
 The space between them — the vacuum — is where emergent behavior lives.
 """
 
-import json
+import asyncio
+import functools
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
 
+from . import _json
+from ._time import utcnow_iso
 from .cartridge import Cartridge
 from .session import Session
 from .providers.base import BaseProvider
@@ -34,9 +38,16 @@ class Probe:
     """
 
     def __init__(self, log_path: Optional[str] = None):
+        self._fh = None
         self.log_path = Path(log_path) if log_path else None
         self.exchanges: List[Dict[str, Any]] = []
         self.start_time = datetime.now(timezone.utc)
+        # Running totals for summary(), updated by log()
+        self._chars_prefix: List[int] = [0]  # running sums of message lengths
+        self._max_round = 0
+        self._sources: Dict[str, None] = {}  # insertion-ordered set
+        # Opened once, unbuffered: each entry is a single write of one line
+        self._fh = open(self.log_path, "ab", buffering=0) if self.log_path else None
 
     def log(
         self,
@@ -48,7 +59,7 @@ class Probe:
         meta: Optional[Dict] = None,
     ) -> Dict[str, Any]:
         entry = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": utcnow_iso(),
             "elapsed_ms": elapsed_ms,
             "round": round_num,
             "source": source,
@@ -57,34 +68,69 @@ class Probe:
             "chars": len(message),
             "meta": meta or {},
         }
-        self.exchanges.append(entry)
+        self._record(entry)
 
-        if self.log_path:
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+        if self._fh:
+            self._fh.write(_json.dumps_line(entry))
 
         return entry
 
+    def _record(self, entry: Dict[str, Any]):
+        self.exchanges.append(entry)
+        self._chars_prefix.append(self._chars_prefix[-1] + entry["chars"])
+        if entry["round"] > self._max_round:
+            self._max_round = entry["round"]
+        self._sources[entry["source"]] = None
+
+    @classmethod
+    def from_log(cls, log_path: str) -> "Probe":
+        """
+        Rebuild an in-memory Probe from a JSONL log, e.g. to summarize
+        an earlier run. The returned Probe does not write to the file.
+        """
+        probe = cls()
+        with open(log_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    probe._record(_json.loads(line))
+        return probe
+
+    def close(self):
+        """Close the log file (entries are already flushed)."""
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "Probe":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
     def summary(self) -> Dict[str, Any]:
         """Generate a summary of the conversation."""
-        if not self.exchanges:
+        prefix = self._chars_prefix
+        n = len(prefix) - 1
+        if not n:
             return {"rounds": 0, "total_chars": 0}
 
-        sources = set(e["source"] for e in self.exchanges)
-        total_chars = sum(e["chars"] for e in self.exchanges)
-        avg_chars = total_chars // len(self.exchanges) if self.exchanges else 0
+        total_chars = prefix[n]
+        avg_chars = total_chars // n
 
         # Track compression: are messages getting shorter?
-        first_half = self.exchanges[: len(self.exchanges) // 2]
-        second_half = self.exchanges[len(self.exchanges) // 2 :]
-        first_avg = sum(e["chars"] for e in first_half) / len(first_half) if first_half else 0
-        second_avg = sum(e["chars"] for e in second_half) / len(second_half) if second_half else 0
+        mid = n // 2
+        first_sum = prefix[mid]
+        first_avg = first_sum / mid if mid else 0
+        second_avg = (total_chars - first_sum) / (n - mid)
         compression_ratio = second_avg / first_avg if first_avg > 0 else 1.0
 
         return {
-            "rounds": max(e["round"] for e in self.exchanges),
-            "exchanges": len(self.exchanges),
-            "participants": list(sources),
+            "rounds": self._max_round,
+            "exchanges": n,
+            "participants": list(self._sources),
             "total_chars": total_chars,
             "avg_chars_per_message": avg_chars,
             "compression_ratio": round(compression_ratio, 3),
@@ -123,6 +169,13 @@ Because you're both AIs:
 Your personality still shapes HOW you communicate, but not the efficiency."""
 
 
+@functools.lru_cache(maxsize=256)
+def _format_preamble(template: str, name: str, peer_name: str) -> str:
+    # Sweeps build many Pipelines over the same persona pairs; they all
+    # share one formatted preamble per pair instead of re-formatting.
+    return template.format(name=name, peer_name=peer_name)
+
+
 class Pipeline:
     """
     Two AIs in structured conversation through Gumdrop cartridges.
@@ -159,29 +212,45 @@ class Pipeline:
 
     def _inject_preamble(self):
         """Add AI-to-AI communication directives to cartridge system prompts."""
+        # Store original get_system_prompt methods
+        self._edge_base = self.edge.cartridge.get_system_prompt
+        self._cloud_base = self.cloud.cartridge.get_system_prompt
+        self.refresh_preamble()
+
+    def refresh_preamble(self):
+        """
+        Re-format the preambles from the current identity names.
+        
+        Only needed after renaming an identity; other cartridge changes
+        reach the prompt on their own.
+        """
         edge_name = self.edge.cartridge.identity.name
         cloud_name = self.cloud.cartridge.identity.name
 
-        # Store original get_system_prompt methods
-        edge_orig = self.edge.cartridge.get_system_prompt
-        cloud_orig = self.cloud.cartridge.get_system_prompt
-
-        edge_preamble = PIPELINE_EDGE_PREAMBLE.format(
-            name=edge_name, peer_name=cloud_name
-        )
-        cloud_preamble = PIPELINE_CLOUD_PREAMBLE.format(
-            name=cloud_name, peer_name=edge_name
-        )
+        edge_preamble = _format_preamble(PIPELINE_EDGE_PREAMBLE, edge_name, cloud_name)
+        cloud_preamble = _format_preamble(PIPELINE_CLOUD_PREAMBLE, cloud_name, edge_name)
 
         # Monkey-patch to prepend preambles
-        def edge_system():
-            return edge_preamble + "\n\n" + edge_orig()
+        self.edge.cartridge.get_system_prompt = self._prepend(edge_preamble, self._edge_base)
+        self.cloud.cartridge.get_system_prompt = self._prepend(cloud_preamble, self._cloud_base)
+
+    @staticmethod
+    def _prepend(preamble: str, base: Callable[[], str]) -> Callable[[], str]:
+        """
+        base() with the preamble in front. The joined string is reused
+        while base() keeps returning its cached prompt, so the system
+        prompt stays the same object (and byte-stable) across rounds.
+        """
+        last = [(None, "")]  # (base prompt, joined), swapped as one tuple
 
-        def cloud_system():
-            return cloud_preamble + "\n\n" + cloud_orig()
+        def system_prompt():
+            prompt = base()
+            cached = last[0]
+            if cached[0] is not prompt:
+                cached = last[0] = (prompt, preamble + "\n\n" + prompt)
+            return cached[1]
 
-        self.edge.cartridge.get_system_prompt = edge_system
-        self.cloud.cartridge.get_system_prompt = cloud_system
+        return system_prompt
 
     def run(
         self,
@@ -194,48 +263,243 @@ class Pipeline:
         
         Returns the Probe with full conversation log.
         """
+        self._converse(self.edge, self.cloud, self.probe, seed, rounds, max_chars_per_message)
+        return self.probe
+
+    async def run_async(
+        self,
+        seed: str,
+        rounds: int = 10,
+        max_chars_per_message: int = 2000,
+    ) -> Probe:
+        """
+        Awaitable run(). Pipelines awaited together (see run_all) overlap
+        their network waits instead of each holding a thread.
+        """
         edge_name = self.edge.cartridge.identity.name
         cloud_name = self.cloud.cartridge.identity.name
 
         current_message = seed
 
         for round_num in range(1, rounds + 1):
-            # Edge responds
             t0 = time.time()
-            edge_response = self.edge.chat(current_message)
+            edge_response = await self.edge.chat_async(current_message, max_chars=max_chars_per_message)
             edge_ms = int((time.time() - t0) * 1000)
-
-            if len(edge_response) > max_chars_per_message:
-                edge_response = edge_response[:max_chars_per_message] + "..."
-
-            self.probe.log(
-                edge_name, cloud_name, edge_response,
-                round_num=round_num, elapsed_ms=edge_ms,
+            edge_response = self._deliver(
+                self.probe, edge_name, cloud_name, edge_response,
+                round_num, edge_ms, max_chars_per_message,
             )
 
-            if self.on_exchange:
-                self.on_exchange(edge_name, edge_response, round_num)
-
-            # Cloud responds to edge
             t0 = time.time()
-            cloud_response = self.cloud.chat(edge_response)
+            cloud_response = await self.cloud.chat_async(edge_response, max_chars=max_chars_per_message)
             cloud_ms = int((time.time() - t0) * 1000)
+            current_message = self._deliver(
+                self.probe, cloud_name, edge_name, cloud_response,
+                round_num, cloud_ms, max_chars_per_message,
+            )
 
-            if len(cloud_response) > max_chars_per_message:
-                cloud_response = cloud_response[:max_chars_per_message] + "..."
+        return self.probe
 
-            self.probe.log(
-                cloud_name, edge_name, cloud_response,
-                round_num=round_num, elapsed_ms=cloud_ms,
+    @staticmethod
+    def run_all(
+        pipelines: List["Pipeline"],
+        seed: str,
+        rounds: int = 10,
+        max_chars_per_message: int = 2000,
+    ) -> List[Probe]:
+        """
+        Run several pipelines concurrently on one event loop.
+        
+        Wall time is close to the slowest pipeline rather than the sum.
+        Pipelines must not share Sessions. Returns each pipeline's Probe.
+        """
+        async def gather():
+            try:
+                return await asyncio.gather(*(
+                    pipe.run_async(seed, rounds, max_chars_per_message) for pipe in pipelines
+                ))
+            finally:
+                # Clients opened on this loop must close before it does
+                providers = {
+                    id(session._provider): session._provider
+                    for pipe in pipelines for session in (pipe.edge, pipe.cloud)
+                }
+                for provider in providers.values():
+                    await provider.aclose_loop()
+        return list(asyncio.run(gather()))
+
+    def run_batch(
+        self,
+        seeds: List[str],
+        rounds: int = 10,
+        max_chars_per_message: int = 2000,
+    ) -> List[Probe]:
+        """
+        Run one independent conversation per seed, concurrently.
+        
+        Each seed gets fresh Sessions over the same cartridges and
+        providers, so histories never mix. The conversations are
+        network-bound and run side by side — total wall time is close
+        to that of the slowest single run.
+        
+        Returns one in-memory Probe per seed, in seed order.
+        """
+        return asyncio.run(self._run_batch(seeds, rounds, max_chars_per_message))
+
+    async def _run_batch(self, seeds, rounds, max_chars_per_message) -> List[Probe]:
+        probes = [Probe() for _ in seeds]
+        await asyncio.gather(*(
+            asyncio.to_thread(self._converse_forked, probe, seed, rounds, max_chars_per_message)
+            for seed, probe in zip(seeds, probes)
+        ))
+        return probes
+
+    def _converse_forked(self, probe, seed, rounds, max_chars_per_message):
+        """run_batch worker: one conversation on forked Sessions, closed after."""
+        edge, cloud = self._fork_session(self.edge), self._fork_session(self.cloud)
+        try:
+            self._converse(edge, cloud, probe, seed, rounds, max_chars_per_message)
+        finally:
+            edge.close()
+            cloud.close()
+
+    @staticmethod
+    def _fork_session(session: Session) -> Session:
+        """A fresh-history Session sharing the cartridge and provider."""
+        return Session(
+            session.cartridge, provider=session._provider,
+            model=session._model, cache=session.cache,
+        )
+
+    def _converse(
+        self,
+        edge: Session,
+        cloud: Session,
+        probe: Probe,
+        seed: str,
+        rounds: int,
+        max_chars_per_message: int,
+    ):
+        edge_name = edge.cartridge.identity.name
+        cloud_name = cloud.cartridge.identity.name
+
+        current_message = seed
+
+        for round_num in range(1, rounds + 1):
+            # Edge responds
+            t0 = time.time()
+            edge_response = edge.chat(current_message, max_chars=max_chars_per_message)
+            edge_ms = int((time.time() - t0) * 1000)
+            edge_response = self._deliver(
+                probe, edge_name, cloud_name, edge_response,
+                round_num, edge_ms, max_chars_per_message,
             )
 
-            if self.on_exchange:
-                self.on_exchange(cloud_name, cloud_response, round_num)
+            # Cloud responds to edge
+            t0 = time.time()
+            cloud_response = cloud.chat(edge_response, max_chars=max_chars_per_message)
+            cloud_ms = int((time.time() - t0) * 1000)
+            cloud_response = self._deliver(
+                probe, cloud_name, edge_name, cloud_response,
+                round_num, cloud_ms, max_chars_per_message,
+            )
 
             # Cloud's response becomes edge's next input
             current_message = cloud_response
 
-        return self.probe
+    def _deliver(
+        self,
+        probe: Probe,
+        speaker: str,
+        peer: str,
+        response: str,
+        round_num: int,
+        elapsed_ms: int,
+        max_chars_per_message: int,
+    ) -> str:
+        """Truncate, log and announce one reply; returns what the peer sees."""
+        if len(response) > max_chars_per_message:
+            response = response[:max_chars_per_message] + "..."
+
+        probe.log(
+            speaker, peer, response,
+            round_num=round_num, elapsed_ms=elapsed_ms,
+        )
+
+        if self.on_exchange:
+            self.on_exchange(speaker, response, round_num)
+        return response
+
+    @staticmethod
+    def run_many(
+        pipelines: List["Pipeline"],
+        seed: str,
+        rounds: int = 10,
+        max_chars_per_message: int = 2000,
+    ) -> List[Probe]:
+        """
+        Run several pipelines in lockstep, one provider batch per side
+        per round.
+        
+        Each round gathers every pipeline's edge turn into a single
+        chat_batch() call per provider, then every cloud turn into a
+        second one. With the Anthropic and OpenAI providers that is a
+        native batch submission (half price, but minutes per batch);
+        other providers send the calls concurrently.
+        
+        Pipelines must not share Sessions. Returns each pipeline's Probe.
+        """
+        messages = [seed] * len(pipelines)
+
+        for round_num in range(1, rounds + 1):
+            for side in ("edge", "cloud"):
+                sessions = [getattr(pipe, side) for pipe in pipelines]
+                replies, elapsed = Pipeline._chat_many(sessions, messages)
+                peers = [pipe.cloud if side == "edge" else pipe.edge for pipe in pipelines]
+                messages = [
+                    pipe._deliver(
+                        pipe.probe,
+                        session.cartridge.identity.name,
+                        peer.cartridge.identity.name,
+                        reply, round_num, ms, max_chars_per_message,
+                    )
+                    for pipe, session, peer, reply, ms in zip(pipelines, sessions, peers, replies, elapsed)
+                ]
+
+        return [pipe.probe for pipe in pipelines]
+
+    @staticmethod
+    def _chat_many(sessions: List[Session], messages: List[str]) -> Tuple[List[str], List[int]]:
+        """One chat turn for every session, batched per (provider, model)."""
+        systems = [session._begin_turn(message) for session, message in zip(sessions, messages)]
+
+        replies: List[str] = [""] * len(sessions)
+        elapsed = [0] * len(sessions)
+
+        groups: Dict[Tuple[int, Optional[str]], List[int]] = {}
+        for i, session in enumerate(sessions):
+            hit = session._cached_reply(systems[i])
+            if hit is not None:
+                session._end_turn(hit)
+                replies[i] = hit
+                continue
+            groups.setdefault((id(session._provider), session._model), []).append(i)
+
+        for indices in groups.values():
+            first = sessions[indices[0]]
+            t0 = time.time()
+            batch = first._provider.chat_batch(
+                [sessions[i].history for i in indices],
+                [systems[i] for i in indices],
+                model=first._model,
+            )
+            batch_ms = int((time.time() - t0) * 1000)
+            for i, reply in zip(indices, batch):
+                sessions[i]._store_reply(systems[i], reply)
+                sessions[i]._end_turn(reply)
+                replies[i] = reply
+                elapsed[i] = batch_ms
+        return replies, elapsed
 
     def inject(self, message: str, as_role: str = "user"):
         """
@@ -253,3 +517,53 @@ class Pipeline:
             lines.append(ex["message"])
             lines.append("")
         return "\n".join(lines)
+
+
+def run_fleet(configs: List[Dict[str, Any]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run independent pipelines in separate worker processes.
+    
+    For sweeps where the per-pipeline work is CPU-bound (summaries,
+    transcripts, other post-processing) rather than network-bound —
+    for the latter, run_all or run_batch in one process is lighter.
+    
+    Each config is a dict of plain, picklable values:
+        edge, cloud          cartridge paths (.gdp)
+        seed                 opening message
+        rounds               default 10
+        max_chars            default 2000
+        edge_provider,       provider name (default "anthropic") or a
+        cloud_provider       picklable BaseProvider instance
+        edge_model,          optional model overrides
+        cloud_model
+        log_path             optional JSONL log for the Probe
+    
+    Each worker loads its own cartridges and builds its own Sessions
+    and provider clients; nothing is shared between processes.
+    Returns {"summary": ..., "log_path": ...} per config, in order.
+    """
+    if not configs:
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_fleet_member, configs))
+
+
+def _run_fleet_member(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker-process body of run_fleet: one pipeline, start to finish."""
+    edge = _fleet_session(config["edge"], config.get("edge_provider", "anthropic"), config.get("edge_model"))
+    cloud = _fleet_session(config["cloud"], config.get("cloud_provider", "anthropic"), config.get("cloud_model"))
+    log_path = config.get("log_path")
+
+    with Probe(log_path=log_path) as probe:
+        Pipeline(edge=edge, cloud=cloud, probe=probe).run(
+            config["seed"],
+            rounds=config.get("rounds", 10),
+            max_chars_per_message=config.get("max_chars", 2000),
+        )
+    edge.close()
+    cloud.close()
+    return {"summary": probe.summary(), "log_path": log_path}
+
+
+def _fleet_session(cart_path: str, provider: Union[str, BaseProvider], model: Optional[str]) -> Session:
+    return Session(Cartridge.load(cart_path), provider=provider, model=model)
@@ -1,8 +1,28 @@
 """LLM Provider adapters for Gumdrop."""
 
+import importlib
+
 from .base import BaseProvider
-from .anthropic import AnthropicProvider
-from .openai import OpenAIProvider
-from .lmstudio import LMStudioProvider
+
+# Adapters are imported on first use (PEP 562), so importing one provider
+# doesn't load the others.
+_LAZY = {
+    "AnthropicProvider": ".anthropic",
+    "OpenAIProvider": ".openai",
+    "LMStudioProvider": ".lmstudio",
+}
 
 __all__ = ["BaseProvider", "AnthropicProvider", "OpenAIProvider", "LMStudioProvider"]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,8 +3,32 @@ Anthropic (Claude) provider for Gumdrop.
 """
 
 import os
+import time
 from typing import List, Dict, Optional, AsyncIterator
-from .base import BaseProvider
+from .base import BaseProvider, _LoopClients
+
+CACHE_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _with_cache_breakpoints(system: str, messages: List[Dict[str, str]]):
+    """
+    System prompt and messages with prompt-cache breakpoints.
+    
+    One breakpoint after the system prompt, one on the newest turn: the
+    next call (same prefix + one more turn) reads everything up to that
+    turn from cache instead of prefilling the whole history again. The
+    caller's messages are not modified.
+    """
+    system_blocks = (
+        [{"type": "text", "text": system, "cache_control": CACHE_EPHEMERAL}] if system else system
+    )
+    if messages and isinstance(messages[-1].get("content"), str):
+        last = messages[-1]
+        messages = messages[:-1] + [{
+            **last,
+            "content": [{"type": "text", "text": last["content"], "cache_control": CACHE_EPHEMERAL}],
+        }]
+    return system_blocks, messages
 
 
 class AnthropicProvider(BaseProvider):
@@ -16,6 +40,8 @@ class AnthropicProvider(BaseProvider):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         self.model = model or self.get_default_model()
         self._client = None
+        # Async clients pool connections on the loop that created them
+        self._async_clients = _LoopClients(self._new_async_client)
     
     def _get_client(self):
         if self._client is None:
@@ -28,6 +54,21 @@ class AnthropicProvider(BaseProvider):
                 )
         return self._client
     
+    def _get_async_client(self):
+        return self._async_clients.get()
+    
+    def _new_async_client(self):
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError(
+                "anthropic package required. Install with: pip install anthropic"
+            )
+        return anthropic.AsyncAnthropic(api_key=self.api_key)
+    
+    async def aclose_loop(self):
+        await self._async_clients.aclose()
+    
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -37,6 +78,7 @@ class AnthropicProvider(BaseProvider):
         max_tokens: int = 4096,
     ) -> str:
         client = self._get_client()
+        system, messages = _with_cache_breakpoints(system, messages)
         
         response = client.messages.create(
             model=model or self.model,
@@ -48,6 +90,27 @@ class AnthropicProvider(BaseProvider):
         
         return response.content[0].text
     
+    async def chat_async(
+        self,
+        messages: List[Dict[str, str]],
+        system: str = "",
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        client = self._get_async_client()
+        system, messages = _with_cache_breakpoints(system, messages)
+        
+        response = await client.messages.create(
+            model=model or self.model,
+            system=system,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        
+        return response.content[0].text
+    
     async def chat_stream(
         self,
         messages: List[Dict[str, str]],
@@ -56,17 +119,62 @@ class AnthropicProvider(BaseProvider):
         temperature: float = 0.7,
         max_tokens: int = 4096,
     ) -> AsyncIterator[str]:
-        client = self._get_client()
+        # The async client, so waiting on the stream doesn't block the loop
+        client = self._get_async_client()
+        system, messages = _with_cache_breakpoints(system, messages)
         
-        with client.messages.stream(
+        async with client.messages.stream(
             model=model or self.model,
             system=system,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
         ) as stream:
-            for text in stream.text_stream:
+            async for text in stream.text_stream:
                 yield text
     
+    def chat_batch(
+        self,
+        conversations: List[List[Dict[str, str]]],
+        systems: Optional[List[str]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        poll_interval: float = 10.0,
+    ) -> List[str]:
+        """
+        Submit every conversation as one Message Batch and wait for it.
+        
+        Batched requests are billed at half price, but the batch can take
+        minutes to finish — this is for sweeps, not interactive chat.
+        """
+        if systems is None:
+            systems = [""] * len(conversations)
+        client = self._get_client()
+        
+        batch = client.messages.batches.create(requests=[
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": model or self.model,
+                    "system": system,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                },
+            }
+            for i, (messages, system) in enumerate(zip(conversations, systems))
+        ])
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+        
+        replies = [""] * len(conversations)
+        for item in client.messages.batches.results(batch.id):
+            if item.result.type != "succeeded":
+                raise RuntimeError(f"Batch request {item.custom_id} {item.result.type}")
+            replies[int(item.custom_id)] = item.result.message.content[0].text
+        return replies
+    
     def get_default_model(self) -> str:
         return "claude-sonnet-4-5-20241022"
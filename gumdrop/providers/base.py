@@ -2,8 +2,157 @@
 Base provider interface for LLM backends.
 """
 
+import asyncio
+import collections
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, List, Dict, Optional, AsyncIterator
+
+
+class _LoopClients:
+    """
+    One async client per event loop.
+    
+    Async clients pool connections on the loop that created them, so each
+    loop (a Session's private loop, a run_batch worker's loop) gets its
+    own instead of replacing a client another thread may still be using.
+    aclose() closes the running loop's client; call it before that loop
+    closes. Entries for loops that are gone drop out by themselves.
+    """
+    
+    def __init__(self, factory: Callable[[], Any], close: str = "close"):
+        self._factory = factory
+        self._close = close  # name of the client's async close method
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+    
+    def get(self) -> Any:
+        """The running loop's client, created on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                client = self._clients[loop] = self._factory()
+        return client
+    
+    def __reduce__(self):
+        # Clients and locks stay in their process; a copy starts empty
+        return (_LoopClients, (self._factory, self._close))
+    
+    async def aclose(self):
+        """Close the running loop's client, if it has one."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await getattr(client, self._close)()
+
+
+class _SharedLimit:
+    """
+    At most `limit` requests in flight at once, across every thread and
+    event loop using the provider. A per-client connection pool can't do
+    this: there is one client per loop.
+    
+    Waiters are served in arrival order. A freed slot passes straight to
+    the next waiter, which is woken on its own thread or loop.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._waiters: collections.deque = collections.deque()  # grant callbacks
+        self._lock = threading.Lock()
+    
+    def __reduce__(self):
+        return (_SharedLimit, (self.limit,))
+    
+    def _take_or_queue(self, grant: Callable[[], bool]) -> bool:
+        """Take a free slot (True) or queue `grant` to be called with one."""
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return True
+            self._waiters.append(grant)
+            return False
+    
+    def _dequeue(self, grant: Callable[[], bool]) -> bool:
+        """Withdraw a waiter; False if it was already handed a slot."""
+        with self._lock:
+            try:
+                self._waiters.remove(grant)
+            except ValueError:
+                return False
+            return True
+    
+    def _release(self):
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._active -= 1
+                    return
+                grant = self._waiters.popleft()
+            if grant():  # the slot now belongs to that waiter
+                return
+    
+    @contextmanager
+    def hold(self):
+        """Block the calling thread until a slot is free; hold it inside."""
+        granted = threading.Event()
+        
+        def grant() -> bool:
+            granted.set()
+            return True
+        
+        if not self._take_or_queue(grant):
+            try:
+                granted.wait()
+            except BaseException:
+                if not self._dequeue(grant):
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+    
+    @asynccontextmanager
+    async def hold_async(self):
+        """Await a free slot without blocking the loop; hold it inside."""
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+        
+        def wake():
+            if granted.cancelled():  # the waiter gave up after being granted
+                self._release()
+            else:
+                granted.set_result(None)
+        
+        def grant() -> bool:
+            try:
+                loop.call_soon_threadsafe(wake)
+            except RuntimeError:  # its loop has closed
+                return False
+            return True
+        
+        if not self._take_or_queue(grant):
+            try:
+                await granted
+            except BaseException:
+                # Still queued: just leave. Granted: give the slot back
+                # here, or in wake() if that hasn't run yet.
+                if not self._dequeue(grant) and granted.done() and not granted.cancelled():
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
 
 
 class BaseProvider(ABC):
@@ -29,6 +178,20 @@ class BaseProvider(ABC):
         """Send a chat completion request and return the response text."""
         ...
     
+    async def chat_async(
+        self,
+        messages: List[Dict[str, str]],
+        system: str = "",
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        """
+        Awaitable chat(). The default runs chat() in a worker thread;
+        providers with an async client override this.
+        """
+        return await asyncio.to_thread(self.chat, messages, system, model, temperature, max_tokens)
+    
     @abstractmethod
     async def chat_stream(
         self,
@@ -41,6 +204,41 @@ class BaseProvider(ABC):
         """Stream a chat completion, yielding text chunks."""
         ...
     
+    def chat_batch(
+        self,
+        conversations: List[List[Dict[str, str]]],
+        systems: Optional[List[str]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> List[str]:
+        """
+        Run several independent chat requests and return the replies in
+        input order. `systems` pairs one system prompt with each conversation.
+        
+        The default sends ordinary chat() calls concurrently. Providers
+        with a native batch API override this.
+        """
+        if systems is None:
+            systems = [""] * len(conversations)
+        if len(conversations) <= 1:
+            return [
+                self.chat(messages, system, model, temperature, max_tokens)
+                for messages, system in zip(conversations, systems)
+            ]
+        with ThreadPoolExecutor(max_workers=min(len(conversations), 16)) as pool:
+            return list(pool.map(
+                lambda messages, system: self.chat(messages, system, model, temperature, max_tokens),
+                conversations, systems,
+            ))
+    
+    async def aclose_loop(self):
+        """
+        Close the async clients opened on the running event loop.
+        Sessions call this before closing their private loop; the
+        default provider has no async clients.
+        """
+    
     def get_default_model(self) -> str:
         """Return the default model for this provider."""
         return "unknown"
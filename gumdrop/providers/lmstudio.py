@@ -6,14 +6,31 @@ OpenAI-compatible endpoint (/v1/chat/completions).
 Defaults to native API for richer metadata.
 """
 
+import importlib.util
 import os
-from typing import List, Dict, Optional, AsyncIterator
-from .base import BaseProvider
+from typing import TYPE_CHECKING, List, Dict, Optional, AsyncIterator
+from .. import _json
+from .base import BaseProvider, _LoopClients, _SharedLimit
 
-try:
+if TYPE_CHECKING:
     import httpx
-except ImportError:
-    httpx = None
+
+# h2 enables HTTP/2 in httpx; checked without importing it
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Server-sent event framing on the OpenAI-compatible stream
+_SSE_DATA = "data: "
+_SSE_DONE = "data: [DONE]"
+
+
+def _httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx package required. Install with: pip install httpx"
+        )
+    return httpx
 
 
 class LMStudioProvider(BaseProvider):
@@ -26,6 +43,7 @@ class LMStudioProvider(BaseProvider):
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         api_format: str = "native",  # "native" or "openai"
+        max_concurrency: int = 8,
     ):
         self.base_url = (
             base_url
@@ -34,9 +52,17 @@ class LMStudioProvider(BaseProvider):
         self.model = model or self.get_default_model()
         self.api_format = api_format
 
-        if httpx is None:
-            raise ImportError("httpx required for LMStudio provider. pip install httpx")
-        self._client = httpx.Client(timeout=120.0)
+        # LMStudio batches whatever is in flight at once (continuous
+        # batching), so concurrent Sessions should reach it concurrently:
+        # up to max_concurrency requests at a time across all Sessions,
+        # threads and loops, each on a kept-alive connection; further
+        # requests wait for a free slot.
+        self.max_concurrency = max_concurrency
+        self._limit = _SharedLimit(max_concurrency)
+        # httpx is imported with the first client, not with this module
+        self._client: Optional["httpx.Client"] = None
+        # One pooled AsyncClient per event loop (connections are bound to it)
+        self._async_clients = _LoopClients(self._new_async_client, close="aclose")
 
     def chat(
         self,
@@ -51,8 +77,63 @@ class LMStudioProvider(BaseProvider):
             return self._chat_native(messages, system, model, temperature, max_tokens)
         return self._chat_openai(messages, system, model, temperature, max_tokens)
 
+    async def chat_async(
+        self,
+        messages: List[Dict[str, str]],
+        system: str = "",
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        client = self._get_async_client()
+        if self.api_format == "native" and len(messages) <= 1:
+            async with self._limit.hold_async():
+                resp = await client.post(
+                    f"{self.base_url}/api/v1/chat",
+                    json=self._native_payload(messages, system, model),
+                )
+            resp.raise_for_status()
+            return self._native_text(resp.json())
+
+        async with self._limit.hold_async():
+            resp = await client.post(
+                f"{self.base_url}/v1/chat/completions",
+                json=self._openai_payload(messages, system, model, temperature, max_tokens),
+            )
+        resp.raise_for_status()
+        return resp.json()["choices"][0]["message"]["content"]
+
+    def _client_options(self) -> Dict:
+        httpx = _httpx()
+        return {
+            "timeout": httpx.Timeout(120.0, pool=None),  # queued requests wait their turn
+            "limits": httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        }
+
+    def _get_client(self) -> "httpx.Client":
+        if self._client is None:
+            self._client = _httpx().Client(**self._client_options())
+        return self._client
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        return self._async_clients.get()
+
+    def _new_async_client(self) -> "httpx.AsyncClient":
+        return _httpx().AsyncClient(http2=HTTP2, **self._client_options())
+
     def _chat_native(self, messages, system, model, temperature, max_tokens) -> str:
         """LMStudio native API: /api/v1/chat"""
+        payload = self._native_payload(messages, system, model)
+
+        with self._limit.hold():
+            resp = self._get_client().post(f"{self.base_url}/api/v1/chat", json=payload)
+        resp.raise_for_status()
+        return self._native_text(resp.json())
+
+    def _native_payload(self, messages, system, model) -> Dict[str, str]:
         # Build input from messages (native API takes a single input string
         # or we can use the last user message)
         last_user = ""
@@ -68,16 +149,14 @@ class LMStudioProvider(BaseProvider):
             context = "\n".join(context_parts[:-1])
             full_system = f"{system}\n\n--- Conversation so far ---\n{context}"
 
-        payload = {
+        return {
             "model": model or self.model,
             "system_prompt": full_system,
             "input": last_user,
         }
 
-        resp = self._client.post(f"{self.base_url}/api/v1/chat", json=payload)
-        resp.raise_for_status()
-        data = resp.json()
-
+    @staticmethod
+    def _native_text(data: Dict) -> str:
         # Extract text from response
         output = data.get("output", [])
         if output and isinstance(output, list):
@@ -89,26 +168,28 @@ class LMStudioProvider(BaseProvider):
 
     def _chat_openai(self, messages, system, model, temperature, max_tokens) -> str:
         """OpenAI-compatible API: /v1/chat/completions"""
-        full_messages = []
+        payload = self._openai_payload(messages, system, model, temperature, max_tokens)
+
+        with self._limit.hold():
+            resp = self._get_client().post(
+                f"{self.base_url}/v1/chat/completions",
+                json=payload,
+            )
+        resp.raise_for_status()
+        data = resp.json()
+        return data["choices"][0]["message"]["content"]
+
+    def _openai_payload(self, messages, system, model, temperature, max_tokens) -> Dict:
         if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+            messages = [{"role": "system", "content": system}, *messages]
 
-        payload = {
+        return {
             "model": model or self.model,
-            "messages": full_messages,
+            "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
 
-        resp = self._client.post(
-            f"{self.base_url}/v1/chat/completions",
-            json=payload,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        return data["choices"][0]["message"]["content"]
-
     async def chat_stream(
         self,
         messages: List[Dict[str, str]],
@@ -117,33 +198,49 @@ class LMStudioProvider(BaseProvider):
         temperature: float = 0.7,
         max_tokens: int = 4096,
     ) -> AsyncIterator[str]:
-        # Streaming via OpenAI-compatible endpoint
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        if self.api_format == "native" and len(messages) <= 1:
+            # Single turns keep the native API, as in chat(); it arrives
+            # as one chunk, so a cap can only trim it afterwards
+            yield await self.chat_async(messages, system, model, temperature, max_tokens)
+            return
 
-        payload = {
-            "model": model or self.model,
-            "messages": full_messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": True,
-        }
+        # Streaming via OpenAI-compatible endpoint
+        payload = self._openai_payload(messages, system, model, temperature, max_tokens)
+        payload["stream"] = True
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            async with client.stream(
-                "POST",
-                f"{self.base_url}/v1/chat/completions",
-                json=payload,
-            ) as resp:
-                async for line in resp.aiter_lines():
-                    if line.startswith("data: ") and line != "data: [DONE]":
-                        import json
-                        chunk = json.loads(line[6:])
-                        delta = chunk.get("choices", [{}])[0].get("delta", {})
-                        if "content" in delta:
-                            yield delta["content"]
+        client = self._get_async_client()
+        # The slot is held until the stream ends or the consumer stops
+        async with self._limit.hold_async(), client.stream(
+            "POST",
+            f"{self.base_url}/v1/chat/completions",
+            json=payload,
+        ) as resp:
+            # aiter_lines reassembles lines split across network chunks
+            async for line in resp.aiter_lines():
+                # Blank keep-alive lines and other SSE fields are skipped
+                # without parsing
+                if line[:6] != _SSE_DATA or line == _SSE_DONE:
+                    continue
+                chunk = _json.loads(line[6:])
+                choices = chunk.get("choices")
+                if choices:
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+
+    def close(self):
+        """Close the sync client. (The async one: await aclose().)"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose_loop(self):
+        await self._async_clients.aclose()
+
+    async def aclose(self):
+        """Close the sync client and the running loop's async client."""
+        await self.aclose_loop()
+        self.close()
 
     def get_default_model(self) -> str:
         return "google/gemma-3n-e4b:2"
@@ -6,8 +6,21 @@ Works with OpenAI, Azure OpenAI, and any OpenAI-compatible API
 """
 
 import os
+import time
 from typing import List, Dict, Optional, AsyncIterator
-from .base import BaseProvider
+from .. import _json
+from .base import BaseProvider, _LoopClients
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_DONE = ("completed", "failed", "expired", "cancelled")
+
+
+def _with_system(system: str, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Chat messages with the system prompt in front, built in one allocation.
+    The caller's list is never modified."""
+    if not system:
+        return messages
+    return [{"role": "system", "content": system}, *messages]
 
 
 class OpenAIProvider(BaseProvider):
@@ -25,6 +38,8 @@ class OpenAIProvider(BaseProvider):
         self.base_url = base_url or os.environ.get("OPENAI_BASE_URL")
         self.model = model or self.get_default_model()
         self._client = None
+        # Async clients pool connections on the loop that created them
+        self._async_clients = _LoopClients(self._new_async_client)
     
     def _get_client(self):
         if self._client is None:
@@ -40,6 +55,24 @@ class OpenAIProvider(BaseProvider):
                 )
         return self._client
     
+    def _get_async_client(self):
+        return self._async_clients.get()
+    
+    def _new_async_client(self):
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError(
+                "openai package required. Install with: pip install openai"
+            )
+        kwargs = {"api_key": self.api_key}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        return AsyncOpenAI(**kwargs)
+    
+    async def aclose_loop(self):
+        await self._async_clients.aclose()
+    
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -51,10 +84,7 @@ class OpenAIProvider(BaseProvider):
         client = self._get_client()
         
         # Prepend system message
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        full_messages = _with_system(system, messages)
         
         response = client.chat.completions.create(
             model=model or self.model,
@@ -65,6 +95,27 @@ class OpenAIProvider(BaseProvider):
         
         return response.choices[0].message.content
     
+    async def chat_async(
+        self,
+        messages: List[Dict[str, str]],
+        system: str = "",
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        client = self._get_async_client()
+        
+        full_messages = _with_system(system, messages)
+        
+        response = await client.chat.completions.create(
+            model=model or self.model,
+            messages=full_messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        
+        return response.choices[0].message.content
+    
     async def chat_stream(
         self,
         messages: List[Dict[str, str]],
@@ -73,14 +124,12 @@ class OpenAIProvider(BaseProvider):
         temperature: float = 0.7,
         max_tokens: int = 4096,
     ) -> AsyncIterator[str]:
-        client = self._get_client()
+        # The async client, so waiting on the stream doesn't block the loop
+        client = self._get_async_client()
         
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        full_messages = _with_system(system, messages)
         
-        stream = client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model=model or self.model,
             messages=full_messages,
             temperature=temperature,
@@ -88,9 +137,70 @@ class OpenAIProvider(BaseProvider):
             stream=True,
         )
         
-        for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        try:
+            async for chunk in stream:
+                if chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()  # a consumer that stops early ends the generation
+    
+    def chat_batch(
+        self,
+        conversations: List[List[Dict[str, str]]],
+        systems: Optional[List[str]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        poll_interval: float = 10.0,
+    ) -> List[str]:
+        """
+        Submit every conversation through the Batch API and wait for it.
+        
+        Batched requests are billed at half price, but the batch can take
+        minutes to finish — this is for sweeps, not interactive chat.
+        Needs the real OpenAI API; compatible servers rarely implement it.
+        """
+        if systems is None:
+            systems = [""] * len(conversations)
+        client = self._get_client()
+        
+        lines = []
+        for i, (messages, system) in enumerate(zip(conversations, systems)):
+            full_messages = _with_system(system, messages)
+            lines.append(_json.dumps_line({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": {
+                    "model": model or self.model,
+                    "messages": full_messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                },
+            }))
+        
+        upload = client.files.create(file=("batch.jsonl", b"".join(lines)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=upload.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        while batch.status not in _BATCH_DONE:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} {batch.status}")
+        
+        replies = [""] * len(conversations)
+        for line in client.files.content(batch.output_file_id).content.splitlines():
+            if not line.strip():
+                continue
+            item = _json.loads(line)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                raise RuntimeError(f"Batch request {item['custom_id']} failed: {item.get('error')}")
+            replies[int(item["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+        return replies
     
     def get_default_model(self) -> str:
         return "gpt-4o"
@@ -5,24 +5,49 @@ A session loads identity from a cartridge, injects it into every LLM call,
 and writes new memories back to the cartridge.
 """
 
-from typing import Optional, List, Dict
+import asyncio
+import importlib
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, Type
 from .cartridge import Cartridge
 from .providers.base import BaseProvider
-from .providers.anthropic import AnthropicProvider
-from .providers.openai import OpenAIProvider
-from .providers.lmstudio import LMStudioProvider
 
+if TYPE_CHECKING:
+    from .cache import ResponseCache
 
+
+# Provider name → (module, class). Modules are imported on first use, so
+# a Session only loads the backend it actually talks to.
 PROVIDER_MAP = {
-    "anthropic": AnthropicProvider,
-    "claude": AnthropicProvider,
-    "openai": OpenAIProvider,
-    "gpt": OpenAIProvider,
-    "lmstudio": LMStudioProvider,
-    "local": LMStudioProvider,
+    "anthropic": (".providers.anthropic", "AnthropicProvider"),
+    "claude": (".providers.anthropic", "AnthropicProvider"),
+    "openai": (".providers.openai", "OpenAIProvider"),
+    "gpt": (".providers.openai", "OpenAIProvider"),
+    "lmstudio": (".providers.lmstudio", "LMStudioProvider"),
+    "local": (".providers.lmstudio", "LMStudioProvider"),
 }
 
 
+def _provider_class(name: str) -> Optional[Type[BaseProvider]]:
+    target = PROVIDER_MAP.get(name.lower())
+    if target is None:
+        return None
+    module, cls = target
+    return getattr(importlib.import_module(module, __package__), cls)
+
+
+# Cap on the rolling summary kept by Session.summarize_and_compress
+SUMMARY_MAX_CHARS = 2000
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class Session:
     """
     A conversation session powered by a cartridge and LLM provider.
@@ -44,6 +69,9 @@ class Session:
         # Switch providers mid-conversation
         session.switch_provider("openai")
         response = session.chat("Same conversation, different brain")
+    
+    Pass `cache=ResponseCache.for_cartridge(cart)` (gumdrop.cache) to
+    answer repeated requests without calling the provider.
     """
     
     def __init__(
@@ -51,16 +79,21 @@ class Session:
         cartridge: Cartridge,
         provider: str | BaseProvider = "anthropic",
         model: Optional[str] = None,
+        cache: Optional["ResponseCache"] = None,
         **provider_kwargs,
     ):
         self.cartridge = cartridge
         self.history: List[Dict[str, str]] = []
         self._model = model
+        self.cache = cache
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # for sync streaming
+        self._rolling_summary = ""  # see summarize_and_compress
+        self._summary_message: Optional[Dict[str, str]] = None
         
         if isinstance(provider, BaseProvider):
             self._provider = provider
         else:
-            provider_cls = PROVIDER_MAP.get(provider.lower())
+            provider_cls = _provider_class(provider)
             if not provider_cls:
                 raise ValueError(
                     f"Unknown provider '{provider}'. "
@@ -68,28 +101,110 @@ class Session:
                 )
             self._provider = provider_cls(model=model, **provider_kwargs)
     
-    def chat(self, message: str) -> str:
+    def chat(self, message: str, max_chars: Optional[int] = None) -> str:
         """
         Send a message and get a response.
         Identity and memory are automatically injected.
+        
+        With `max_chars`, the reply is streamed and generation is cut off
+        once it runs past that length (the reply may overshoot by part of
+        a chunk). Inside a running event loop this falls back to a full
+        request; use chat_async there.
         """
-        # Add user message to history
-        self.history.append({"role": "user", "content": message})
+        system = self._begin_turn(message)
+        
+        response = self._cached_reply(system)
+        if response is None:
+            complete = True
+            if max_chars is not None and not _in_event_loop():
+                response, complete = self._run_sync(self._stream_capped(system, max_chars))
+            else:
+                # Send to LLM
+                response = self._provider.chat(
+                    messages=self.history,
+                    system=system,
+                    model=self._model,
+                )
+            if complete:
+                self._store_reply(system, response)
+        
+        self._end_turn(response)
+        return response
+    
+    async def chat_async(self, message: str, max_chars: Optional[int] = None) -> str:
+        """Awaitable chat(); lets many sessions overlap their network waits."""
+        system = self._begin_turn(message)
         
-        # Build system prompt from cartridge
-        system = self.cartridge.get_system_prompt()
+        response = self._cached_reply(system)
+        if response is None:
+            complete = True
+            if max_chars is not None:
+                response, complete = await self._stream_capped(system, max_chars)
+            else:
+                response = await self._provider.chat_async(
+                    messages=self.history,
+                    system=system,
+                    model=self._model,
+                )
+            if complete:
+                self._store_reply(system, response)
         
-        # Send to LLM
-        response = self._provider.chat(
+        self._end_turn(response)
+        return response
+    
+    async def _stream_capped(self, system: str, max_chars: int) -> Tuple[str, bool]:
+        """Stream a reply, closing the stream once it exceeds max_chars.
+        Returns (text, complete)."""
+        parts = []
+        length = 0
+        async with aclosing(self._provider.chat_stream(
             messages=self.history,
             system=system,
             model=self._model,
-        )
-        
-        # Add assistant response to history
+        )) as stream:
+            async for chunk in stream:
+                parts.append(chunk)
+                length += len(chunk)
+                if length > max_chars:
+                    return "".join(parts), False
+        return "".join(parts), True
+    
+    def _run_sync(self, coro):
+        # One private loop per session, so async clients that pool per
+        # loop (LMStudio) keep their connections between turns
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def close(self):
+        """
+        Release the session's private event loop, if one was started,
+        along with the provider's async clients on it.
+        """
+        loop, self._loop = self._loop, None
+        if loop is not None:
+            if not _in_event_loop():  # can't drive it from inside another loop
+                loop.run_until_complete(self._provider.aclose_loop())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def _begin_turn(self, message: str) -> str:
+        """Record the user message; return the system prompt for the call."""
+        self.history.append({"role": "user", "content": message})
+        return self.cartridge.get_system_prompt()
+    
+    def _cached_reply(self, system: str) -> Optional[str]:
+        return self.cache.get(system, self.history) if self.cache else None
+    
+    def _store_reply(self, system: str, response: str):
+        if self.cache:
+            self.cache.put(system, self.history, response)
+    
+    def _end_turn(self, response: str):
         self.history.append({"role": "assistant", "content": response})
-        
-        return response
     
     def switch_provider(
         self,
@@ -104,7 +219,7 @@ class Session:
         if isinstance(provider, BaseProvider):
             self._provider = provider
         else:
-            provider_cls = PROVIDER_MAP.get(provider.lower())
+            provider_cls = _provider_class(provider)
             if not provider_cls:
                 raise ValueError(f"Unknown provider '{provider}'")
             self._provider = provider_cls(model=model, **provider_kwargs)
@@ -118,11 +233,16 @@ class Session:
     def clear_history(self):
         """Clear conversation history (memory persists in cartridge)."""
         self.history.clear()
+        self._rolling_summary = ""
+        self._summary_message = None
     
     def summarize_and_compress(self):
         """
         Compress conversation history by summarizing older messages.
         Keeps recent messages verbatim, summarizes older ones.
+        
+        The summary rolls: each call adds only the turns compressed since
+        the previous one, and keeps the newest SUMMARY_MAX_CHARS of it.
         """
         if len(self.history) < 20:
             return
@@ -130,19 +250,21 @@ class Session:
         # Keep last 10 messages verbatim
         recent = self.history[-10:]
         older = self.history[:-10]
+        if older and older[0] is self._summary_message:
+            older = older[2:]  # summary + acknowledgement, already folded in
         
-        # Build summary of older messages
-        summary_parts = []
-        for msg in older:
-            role = msg["role"]
-            content = msg["content"][:100]
-            summary_parts.append(f"[{role}]: {content}...")
-        
-        summary = "Previous conversation summary:\n" + "\n".join(summary_parts)
+        # Summarize just the newly compressed turns
+        delta = "\n".join(f"[{msg['role']}]: {msg['content'][:100]}..." for msg in older)
+        summary = f"{self._rolling_summary}\n{delta}" if self._rolling_summary else delta
+        if len(summary) > SUMMARY_MAX_CHARS:
+            summary = summary[-SUMMARY_MAX_CHARS:]
+            summary = summary[summary.find("\n") + 1:]  # start on a whole line
+        self._rolling_summary = summary
+        self._summary_message = {"role": "user", "content": "Previous conversation summary:\n" + summary}
         
         # Replace history with summary + recent
         self.history = [
-            {"role": "user", "content": summary},
+            self._summary_message,
             {"role": "assistant", "content": "I remember our earlier conversation. Let's continue."},
         ] + recent
     
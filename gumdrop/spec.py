@@ -53,6 +53,9 @@ DEFAULT_TRAITS = {
     "assertiveness": 0.5,
 }
 
+# Canonical trait order for fixed-layout (vector) views of a personality
+TRAIT_KEYS = tuple(DEFAULT_TRAITS)
+
 # Trait descriptions for system prompt generation
 TRAIT_DESCRIPTIONS = {
     "warmth": {
@@ -29,6 +29,7 @@ characters. High directness uses sharper ones. The interplay creates
 a texture that's visually distinct per personality.
 """
 
+import functools
 import hashlib
 from typing import Dict, List, Optional, Tuple
 
@@ -78,6 +79,15 @@ PALETTES = {
     },
 }
 
+# PALETTES flattened once for generate_matrix: trait → band →
+# (characters as a tuple, count). Tuple items are reused str objects;
+# indexing a non-ASCII str builds a new one each time.
+_TRAIT_NAMES = tuple(PALETTES)
+_PALETTE_BANDS = {
+    trait: {band: (tuple(chars), len(chars)) for band, chars in bands.items()}
+    for trait, bands in PALETTES.items()
+}
+
 # Box drawing characters for the frame
 FRAME = {
     "tl": "╭", "tr": "╮", "bl": "╰", "br": "╯",
@@ -94,9 +104,16 @@ def _trait_band(value: float) -> str:
     return "mid"
 
 
+@functools.lru_cache(maxsize=256)
 def _hash_bytes(data: str) -> bytes:
-    """Get deterministic hash bytes from a string."""
-    return hashlib.sha256(data.encode("utf-8")).digest()
+    """
+    Get deterministic hash bytes from a string.
+    
+    Stays SHA-256: every existing thumbprint is derived from these bytes,
+    so a different hash would change how every cartridge looks. This is
+    layout seeding, not security, hence usedforsecurity=False.
+    """
+    return hashlib.sha256(data.encode("utf-8"), usedforsecurity=False).digest()
 
 
 def generate_matrix(
@@ -119,53 +136,102 @@ def generate_matrix(
     Returns a list of strings (one per row).
     """
     # Seed from identity
-    seed = _hash_bytes(f"{name}:{owner_hash}")
-    seed_ints = list(seed)  # 32 bytes of deterministic randomness
+    seed = _hash_bytes(f"{name}:{owner_hash}")  # 32 bytes of deterministic randomness
+    
+    # Build palette for this personality: (chars, count) per trait
+    active_palettes = [
+        _PALETTE_BANDS[t][_trait_band(traits.get(t, 0.5))] for t in _TRAIT_NAMES
+    ]
     
-    # Build palette for this personality
-    trait_names = list(PALETTES.keys())
-    active_palettes = []
-    for t in trait_names:
-        band = _trait_band(traits.get(t, 0.5))
-        chars = PALETTES[t][band]
-        active_palettes.append(chars)
+    if 0 < width * height <= _KERNEL_MAX_CELLS:
+        chars, counts = zip(*active_palettes)
+        return _matrix_kernel(width, height)(chars, counts, seed)
+    
+    # Cell (x, y) draws from palette (x + 3y) % n, offset by
+    # seed[(x + y) % 32]. Both sequences just rotate from row to row, so
+    # each row takes a slice of a repeated cycle instead of doing the
+    # modulo per cell.
+    n = len(active_palettes)
+    palette_cycle = active_palettes * (width // n + 2)
+    seed_cycle = seed * (width // 32 + 2)
     
     rows = []
     for y in range(height):
-        row = []
-        for x in range(width):
-            # Which trait palette to use for this cell
-            palette_idx = (x + y * 3) % len(active_palettes)
-            palette = active_palettes[palette_idx]
-            
-            # Which character from that palette
-            seed_idx = (x * 7 + y * 13 + seed_ints[(x + y) % 32]) % len(palette)
-            row.append(palette[seed_idx])
-        rows.append("".join(row))
+        p0 = (y * 3) % n
+        s0 = y % 32
+        rows.append("".join([
+            chars[(base + offset) % count]
+            for base, (chars, count), offset in zip(
+                range(y * 13, y * 13 + width * 7, 7),  # x * 7 + y * 13
+                palette_cycle[p0:p0 + width],
+                seed_cycle[s0:s0 + width],
+            )
+        ]))
     
     return rows
 
 
+# Shapes up to this many cells get a compiled kernel (see _matrix_kernel);
+# bigger ones would spend more compiling than they save
+_KERNEL_MAX_CELLS = 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _matrix_kernel(width: int, height: int):
+    """
+    generate_matrix's cell loop compiled for one (width, height).
+    
+    Most thumbprints come in a couple of shapes (18x6, 12x3), so the
+    loop is unrolled once per shape with every position-dependent
+    index — palette slot, x*7 + y*13 base, seed byte — written in as a
+    constant. The kernel takes the per-trait character tuples, their
+    counts and the seed, and returns the rows.
+    """
+    n = len(_TRAIT_NAMES)
+    slots = ", ".join(f"c{i}" for i in range(n))
+    sizes = ", ".join(f"k{i}" for i in range(n))
+    lines = [
+        "def kernel(chars, counts, seed):",
+        f"    {slots}, = chars",
+        f"    {sizes}, = counts",
+        "    return [",
+    ]
+    for y in range(height):
+        cells = ", ".join(
+            f"c{(x + y * 3) % n}[({x * 7 + y * 13} + seed[{(x + y) % 32}]) % k{(x + y * 3) % n}]"
+            for x in range(width)
+        )
+        lines.append(f'        "".join(({cells},)),')
+    lines.append("    ]")
+    
+    namespace: Dict[str, object] = {}
+    exec(compile("\n".join(lines), f"<thumbprint kernel {width}x{height}>", "exec"), namespace)
+    return namespace["kernel"]
+
+
 def generate_label(
     name: str,
     voice: str = "",
     owner_hash: str = "",
 ) -> List[str]:
     """Generate the text label below the matrix."""
-    lines = []
-    
+    return _label_lines(name, voice, owner_hash)[0]
+
+
+def _label_lines(name: str, voice: str, owner_hash: str) -> Tuple[List[str], int]:
+    """generate_label's lines plus the longest line's length, for the frame."""
     # Name + short voice descriptor
     voice_short = voice.split(",")[0].strip() if voice else ""
     if voice_short:
-        lines.append(f" {name} · {voice_short}")
+        title = f" {name} · {voice_short}"
     else:
-        lines.append(f" {name}")
+        title = f" {name}"
     
     # Short hash + dominant traits
     short_hash = owner_hash[:4] if owner_hash else "0000"
-    lines.append(f" {short_hash}")
+    hash_line = f" {short_hash}"
     
-    return lines
+    return [title, hash_line], max(len(title), len(hash_line))
 
 
 def render(
@@ -180,38 +246,40 @@ def render(
     """
     Render a complete thumbprint with optional frame.
     
-    Returns a multi-line string ready for display.
+    Returns a multi-line string ready for display. Results are cached
+    per input, so re-rendering the same cartridge is a lookup.
     """
-    matrix = generate_matrix(traits, name, owner_hash, width, height)
-    label = generate_label(name, voice, owner_hash)
+    return _render_cached(tuple(traits.items()), name, voice, owner_hash, width, height, framed)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_cached(
+    trait_items: Tuple[Tuple[str, float], ...],
+    name: str,
+    voice: str,
+    owner_hash: str,
+    width: int,
+    height: int,
+    framed: bool,
+) -> str:
+    matrix = generate_matrix(dict(trait_items), name, owner_hash, width, height)
+    label, label_width = _label_lines(name, voice, owner_hash)
     
     if not framed:
         return "\n".join(matrix + [""] + label)
     
     # Calculate frame width
-    content_width = max(width, max(len(l) for l in label) if label else 0) + 2
-    
-    lines = []
-    # Top border
-    lines.append(f"{FRAME['tl']}{FRAME['h'] * content_width}{FRAME['tr']}")
-    
-    # Matrix rows
-    for row in matrix:
-        padded = f" {row}".ljust(content_width)
-        lines.append(f"{FRAME['v']}{padded}{FRAME['v']}")
-    
-    # Separator
-    lines.append(f"{FRAME['v']}{' ' * content_width}{FRAME['v']}")
-    
-    # Label rows
-    for label_line in label:
-        padded = label_line.ljust(content_width)
-        lines.append(f"{FRAME['v']}{padded}{FRAME['v']}")
-    
-    # Bottom border
-    lines.append(f"{FRAME['bl']}{FRAME['h'] * content_width}{FRAME['br']}")
+    content_width = max(width, label_width) + 2
     
-    return "\n".join(lines)
+    v = FRAME["v"]
+    border = FRAME["h"] * content_width
+    return "\n".join([
+        f"{FRAME['tl']}{border}{FRAME['tr']}",
+        *[f"{v} {row.ljust(content_width - 1)}{v}" for row in matrix],
+        f"{v}{' ' * content_width}{v}",  # separator
+        *[f"{v}{line.ljust(content_width)}{v}" for line in label],
+        f"{FRAME['bl']}{border}{FRAME['br']}",
+    ])
 
 
 def from_cartridge(cartridge, **kwargs) -> str:
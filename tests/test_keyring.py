@@ -0,0 +1,52 @@
+"""Tests for cartridge signing."""
+
+import hashlib
+import hmac
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+from gumdrop import Cartridge
+from gumdrop.keyring import SIGNATURE_ALGORITHM, KeyPair, Keyring, Signer
+
+
+def test_sign_uses_keyed_blake2b():
+    """New signatures are keyed BLAKE2b and verify with the keypair."""
+    kp = KeyPair.generate()
+    cart = Cartridge.create(name="Blake").sign(kp)
+    
+    assert cart._signature["algorithm"] == "blake2b-256"
+    assert cart.verify(kp)
+    assert not cart.verify(KeyPair.generate())
+
+
+def test_legacy_hmac_signature_still_verifies():
+    """Cartridges signed with HMAC-SHA256 keep verifying."""
+    kp = KeyPair.generate()
+    data = asdict(Cartridge.create(name="Legacy")._data)
+    payload = Signer._canonical_payload(data, kp.public_key)
+    sig_block = Signer.sign(data, kp)
+    sig_block["algorithm"] = "hmac-sha256"
+    sig_block["signature"] = hmac.new(kp.private_key, payload, hashlib.sha256).hexdigest()
+    
+    assert Signer.verify_with_key(data, sig_block, kp)
+    sig_block["algorithm"] = "rot13"
+    assert not Signer.verify_with_key(data, sig_block, kp)
+
+
+def test_list_keys_uses_index():
+    """list_keys caches metadata in an index and notices changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        kr = Keyring(Path(tmpdir))
+        first = kr.generate()
+        kr.generate()
+        
+        assert len(kr.list_keys()) == 2
+        assert (Path(tmpdir) / "_index.json").exists()
+        assert len(kr.list_keys()) == 2
+        
+        kr.delete(first.key_id)
+        keys = kr.list_keys()
+        assert len(keys) == 1
+        assert keys[0]["key_id"] != first.key_id
+        assert keys[0]["algorithm"] == SIGNATURE_ALGORITHM
@@ -0,0 +1,350 @@
+"""Tests for the Pipeline and Probe."""
+
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from gumdrop import Cartridge, Session, Pipeline, Probe
+from gumdrop.pipeline import run_fleet
+from gumdrop.providers.anthropic import AnthropicProvider
+from gumdrop.providers.base import BaseProvider
+from gumdrop.providers.lmstudio import LMStudioProvider
+from gumdrop.providers.openai import OpenAIProvider
+
+
+class EchoProvider(BaseProvider):
+    """Offline provider that echoes the last user message."""
+
+    name = "echo"
+
+    def __init__(self, model=None):
+        self.model = model
+        self.calls = 0
+
+    def chat(self, messages, system="", model=None, temperature=0.7, max_tokens=4096):
+        self.calls += 1
+        return f"re: {messages[-1]['content']}"
+
+    async def chat_stream(self, messages, system="", model=None, temperature=0.7, max_tokens=4096):
+        yield self.chat(messages, system, model, temperature, max_tokens)
+
+
+class SlowStream:
+    """Async stream of one chunk that arrives after a delay."""
+
+    def __init__(self, chunk, delay):
+        self.chunk, self.delay, self.done = chunk, delay, False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.done:
+            raise StopAsyncIteration
+        await asyncio.sleep(self.delay)
+        self.done = True
+        return self.chunk
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        self.text_stream = self
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+def slow_async_client(delay):
+    """Stand-in for AsyncOpenAI / AsyncAnthropic whose streams sleep."""
+    async def create(messages, stream=False, **kwargs):
+        delta = SimpleNamespace(content=f"re: {messages[-1]['content']}")
+        return SlowStream(SimpleNamespace(choices=[SimpleNamespace(delta=delta)]), delay)
+
+    def stream(messages, **kwargs):
+        return SlowStream(f"re: {messages[-1]['content'][0]['text']}", delay)
+
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)),
+        messages=SimpleNamespace(stream=stream),
+    )
+
+
+def mock_lmstudio(delay=0.0, **kwargs):
+    """LMStudioProvider answering from an in-process httpx transport.
+    Records every async client it opens in `provider.opened`, and the
+    most requests it saw in flight at once in `provider.peak`."""
+    httpx = pytest.importorskip("httpx")
+    lock = threading.Lock()
+    in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight
+        with lock:
+            in_flight += 1
+            provider.peak = max(provider.peak, in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            with lock:
+                in_flight -= 1
+        payload = json.loads(request.content)
+        reply = f"re: {payload['messages'][-1]['content']}"
+        if not payload.get("stream"):
+            return httpx.Response(200, json={"choices": [{"message": {"content": reply}}]})
+        chunk = {"choices": [{"delta": {"content": reply}}]}
+        return httpx.Response(200, text=f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n")
+
+    provider = LMStudioProvider(api_format="openai", **kwargs)
+    options = provider._client_options
+    provider._client_options = lambda: {**options(), "transport": httpx.MockTransport(handler)}
+    provider.opened = []
+    provider.peak = 0
+    new_async_client = provider._new_async_client
+
+    def record():
+        client = new_async_client()
+        provider.opened.append(client)
+        return client
+
+    provider._async_clients._factory = record
+    return provider
+
+
+def make_pipeline():
+    edge = Session(Cartridge.create(name="Spark"), provider=EchoProvider())
+    cloud = Session(Cartridge.create(name="Root"), provider=EchoProvider())
+    return Pipeline(edge=edge, cloud=cloud)
+
+
+def test_run_logs_both_speakers():
+    """Each round logs one edge and one cloud exchange."""
+    pipe = make_pipeline()
+    probe = pipe.run("hello", rounds=3)
+
+    assert len(probe.exchanges) == 6
+    assert probe.exchanges[0]["source"] == "Spark"
+    assert probe.exchanges[1]["source"] == "Root"
+    assert probe.exchanges[1]["message"] == "re: re: hello"
+    assert probe.summary()["rounds"] == 3
+
+
+def test_preamble_is_stable_and_refreshable():
+    """The wrapped prompt is reused until the cartridge or names change."""
+    pipe = make_pipeline()
+    cart = pipe.edge.cartridge
+    prompt = cart.get_system_prompt()
+    assert prompt.startswith("You are Spark, talking to another AI system (Root).")
+    assert cart.get_system_prompt() is prompt
+
+    cart.directives = ["Be brief."]
+    assert "- Be brief." in cart.get_system_prompt()
+
+    pipe.cloud.cartridge.identity.name = "Trunk"
+    pipe.refresh_preamble()
+    assert "(Trunk)" in cart.get_system_prompt()
+    assert cart.get_system_prompt().count("talking to another AI system") == 1
+
+
+def test_probe_log_round_trips():
+    """A Probe rebuilt from its JSONL log summarizes the same way."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_path = Path(tmpdir) / "probe.jsonl"
+        pipe = make_pipeline()
+        pipe.probe = Probe(log_path=str(log_path))
+        pipe.run("héllo", rounds=2)
+        pipe.probe.close()
+
+        replay = Probe.from_log(str(log_path))
+        assert replay.exchanges == pipe.probe.exchanges
+        assert replay.summary()["total_chars"] == pipe.probe.summary()["total_chars"]
+
+
+def test_run_batch_keeps_histories_apart():
+    """Batched seeds run as independent conversations."""
+    pipe = make_pipeline()
+    probes = pipe.run_batch(["alpha", "beta"], rounds=2)
+
+    assert [p.exchanges[0]["message"] for p in probes] == ["re: alpha", "re: beta"]
+    assert all(len(p.exchanges) == 4 for p in probes)
+    assert pipe.edge.history == []
+
+
+def test_run_batch_gives_each_loop_its_own_client():
+    """Worker threads don't share or leak async clients."""
+    provider = mock_lmstudio()
+    pipe = Pipeline(
+        edge=Session(Cartridge.create(name="Spark"), provider=provider),
+        cloud=Session(Cartridge.create(name="Root"), provider=provider),
+    )
+    probes = pipe.run_batch(["alpha", "beta"], rounds=2)
+
+    assert [p.exchanges[1]["message"] for p in probes] == ["re: re: alpha", "re: re: beta"]
+    # One client per forked session's loop, each closed with its session
+    assert len(provider.opened) == 4
+    assert all(client.is_closed for client in provider.opened)
+
+
+def test_max_concurrency_spans_threads_and_loops():
+    """Requests from many loops share one in-flight limit per provider."""
+    provider = mock_lmstudio(delay=0.02, max_concurrency=3)
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def burst():
+        replies = await asyncio.gather(*(provider.chat_async(messages) for _ in range(4)))
+        await provider.aclose_loop()
+        return replies
+
+    threads = [threading.Thread(target=lambda: asyncio.run(burst())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(provider.opened) == 3
+    assert provider.peak == 3
+
+
+def test_run_many_batches_each_side():
+    """run_many advances every pipeline one batched turn at a time."""
+    edge_provider, cloud_provider = EchoProvider(), EchoProvider()
+    pipes = [
+        Pipeline(
+            edge=Session(Cartridge.create(name=f"Spark{i}"), provider=edge_provider),
+            cloud=Session(Cartridge.create(name=f"Root{i}"), provider=cloud_provider),
+        )
+        for i in range(3)
+    ]
+    probes = Pipeline.run_many(pipes, "hello", rounds=2)
+
+    assert all(len(p.exchanges) == 4 for p in probes)
+    assert probes[2].exchanges[0]["source"] == "Spark2"
+    assert probes[0].exchanges[3]["message"] == "re: re: re: re: hello"
+    assert edge_provider.calls == cloud_provider.calls == 6
+
+
+def test_run_all_overlaps_pipelines():
+    """run_all drives each pipeline through the async chat path."""
+    pipes = [make_pipeline() for _ in range(2)]
+    probes = Pipeline.run_all(pipes, "hello", rounds=2)
+
+    assert all(len(p.exchanges) == 4 for p in probes)
+    assert probes[1].exchanges[1]["message"] == "re: re: hello"
+    assert pipes[0].edge.history[-1]["content"] == "re: re: re: hello"
+
+
+def test_run_all_overlaps_provider_streams():
+    """Capped turns stream on the async clients, so pipelines overlap."""
+    delay, count = 0.05, 4
+    pipes = []
+    for provider_cls in (OpenAIProvider, AnthropicProvider) * (count // 2):
+        providers = [provider_cls(api_key="test"), provider_cls(api_key="test")]
+        for provider in providers:
+            provider._get_async_client = lambda: slow_async_client(delay)
+        pipes.append(Pipeline(
+            edge=Session(Cartridge.create(name="Spark"), provider=providers[0]),
+            cloud=Session(Cartridge.create(name="Root"), provider=providers[1]),
+        ))
+
+    start = time.perf_counter()
+    probes = Pipeline.run_all(pipes, "hello", rounds=1)
+    elapsed = time.perf_counter() - start
+
+    assert [p.exchanges[1]["message"] for p in probes] == ["re: re: hello"] * count
+    # Two turns per pipeline: about 2 * delay overlapped, 2 * delay * count serially
+    assert elapsed < delay * count
+
+
+def test_run_fleet_runs_each_config():
+    """Fleet members load their own cartridges and report back in order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        edge_path, cloud_path = Path(tmpdir) / "spark.gdp", Path(tmpdir) / "root.gdp"
+        Cartridge.create(name="Spark").save(edge_path)
+        Cartridge.create(name="Root").save(cloud_path)
+        configs = [
+            {
+                "edge": str(edge_path), "cloud": str(cloud_path),
+                "edge_provider": EchoProvider(), "cloud_provider": EchoProvider(),
+                "seed": seed, "rounds": 2,
+                "log_path": str(Path(tmpdir) / f"{seed}.jsonl"),
+            }
+            for seed in ("a", "bb")
+        ]
+
+        results = run_fleet(configs, workers=2)
+
+        assert [r["summary"]["exchanges"] for r in results] == [4, 4]
+        assert results[1]["summary"]["total_chars"] > results[0]["summary"]["total_chars"]
+        replay = Probe.from_log(results[1]["log_path"])
+        assert replay.exchanges[-1]["message"] == "re: re: re: re: bb"
+
+
+def test_session_cache_skips_provider():
+    """A repeated request is answered from the response cache."""
+    from gumdrop.cache import ResponseCache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResponseCache(Path(tmpdir) / "cache.db")
+        cart = Cartridge.create(name="Spark")
+        provider = EchoProvider()
+
+        first = Session(cart, provider=provider, cache=cache).chat("hello")
+        second = Session(cart, provider=provider, cache=cache).chat("hello")
+
+        assert first == second == "re: hello"
+        assert provider.calls == 1
+        cache.close()
+
+
+class ChattyProvider(EchoProvider):
+    """Streams a long reply in small chunks and counts what was pulled."""
+
+    name = "chatty"
+
+    def __init__(self, model=None):
+        super().__init__(model)
+        self.chunks_sent = 0
+
+    async def chat_stream(self, messages, system="", model=None, temperature=0.7, max_tokens=4096):
+        for _ in range(1000):
+            self.chunks_sent += 1
+            yield "word "
+
+
+def test_run_stops_streaming_at_the_cap():
+    """Replies past max_chars_per_message stop generating and are truncated."""
+    provider = ChattyProvider()
+    pipe = Pipeline(
+        edge=Session(Cartridge.create(name="Spark"), provider=provider),
+        cloud=Session(Cartridge.create(name="Root"), provider=EchoProvider()),
+    )
+    probe = pipe.run("hello", rounds=1, max_chars_per_message=50)
+
+    assert probe.exchanges[0]["message"] == "word " * 10 + "..."
+    assert provider.chunks_sent == 11
+
+
+def test_summarize_and_compress_rolls():
+    """Repeated compression keeps earlier summaries instead of truncating them."""
+    session = Session(Cartridge.create(name="Spark"), provider=EchoProvider())
+    for i in range(12):
+        session.chat(f"turn {i}")
+    session.summarize_and_compress()
+    first = session.history[0]["content"]
+    assert len(session.history) == 12
+    assert "[user]: turn 0..." in first
+
+    for i in range(12, 16):
+        session.chat(f"turn {i}")
+    session.summarize_and_compress()
+    second = session.history[0]["content"]
+    assert second.startswith(first)
+    assert "[user]: turn 7..." in second
+    assert second.count("Previous conversation summary") == 1
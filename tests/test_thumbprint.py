@@ -0,0 +1,92 @@
+"""Tests for thumbprint generation."""
+
+import hashlib
+import random
+
+from gumdrop import thumbprint
+from gumdrop.thumbprint import FRAME, PALETTES, compact, generate_matrix, render
+
+
+def reference_matrix(traits, name, owner_hash="", width=18, height=6):
+    """The plain per-cell loop generate_matrix must agree with."""
+    seed = hashlib.sha256(f"{name}:{owner_hash}".encode("utf-8")).digest()
+    palettes = [PALETTES[t][thumbprint._trait_band(traits.get(t, 0.5))] for t in PALETTES]
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            palette = palettes[(x + y * 3) % len(palettes)]
+            row.append(palette[(x * 7 + y * 13 + seed[(x + y) % 32]) % len(palette)])
+        rows.append("".join(row))
+    return rows
+
+
+def reference_render(traits, name, voice="", owner_hash="", width=18, height=6, framed=True):
+    """The plain line-by-line frame render must agree with."""
+    matrix = reference_matrix(traits, name, owner_hash, width, height)
+    voice_short = voice.split(",")[0].strip() if voice else ""
+    label = [f" {name} · {voice_short}" if voice_short else f" {name}",
+             f" {owner_hash[:4] if owner_hash else '0000'}"]
+    if not framed:
+        return "\n".join(matrix + [""] + label)
+
+    content_width = max(width, max(len(line) for line in label)) + 2
+    lines = [f"{FRAME['tl']}{FRAME['h'] * content_width}{FRAME['tr']}"]
+    for row in matrix:
+        lines.append(f"{FRAME['v']}{f' {row}'.ljust(content_width)}{FRAME['v']}")
+    lines.append(f"{FRAME['v']}{' ' * content_width}{FRAME['v']}")
+    for line in label:
+        lines.append(f"{FRAME['v']}{line.ljust(content_width)}{FRAME['v']}")
+    lines.append(f"{FRAME['bl']}{FRAME['h'] * content_width}{FRAME['br']}")
+    return "\n".join(lines)
+
+
+def random_traits(rng):
+    """A trait dict mixing all three bands, with some traits left out."""
+    return {t: rng.choice([0.0, 0.3, 0.5, 0.7, 1.0]) for t in PALETTES if rng.random() < 0.8}
+
+
+# Kernel path (1..1024 cells), the row-loop fallback above it, and edges
+SHAPES = [
+    (18, 6), (12, 3), (1, 1), (1, 40), (40, 1), (7, 5), (32, 32),
+    (32, 33), (40, 40), (100, 2), (0, 0), (0, 6), (18, 0), (1, 0), (0, 1),
+]
+
+
+def test_matrix_matches_reference():
+    """Every code path yields the same cells as the per-cell loop."""
+    rng = random.Random(7)
+    for width, height in SHAPES:
+        for _ in range(5):
+            traits = random_traits(rng)
+            name = rng.choice(["Atlas", "Spark", "Ünïcode", ""])
+            owner_hash = rng.choice(["", "a3f8c0ffee", "0" * 64])
+            expected = reference_matrix(traits, name, owner_hash, width, height)
+            assert generate_matrix(traits, name, owner_hash, width, height) == expected
+
+
+def test_kernel_threshold():
+    """Shapes up to _KERNEL_MAX_CELLS compile a kernel; bigger ones don't."""
+    thumbprint._matrix_kernel.cache_clear()
+    generate_matrix({}, "Edge", width=32, height=32)
+    generate_matrix({}, "Edge", width=32, height=33)
+    generate_matrix({}, "Edge", width=0, height=6)
+    assert thumbprint._matrix_kernel.cache_info().currsize == 1
+
+
+def test_render_matches_reference():
+    """Framed and unframed renders match a line-by-line build."""
+    rng = random.Random(11)
+    for width, height in SHAPES:
+        traits = random_traits(rng)
+        for voice in ("", "warm, direct", "a very long voice descriptor indeed"):
+            for framed in (True, False):
+                expected = reference_render(traits, "Atlas", voice, "a3f8", width, height, framed)
+                assert render(traits, "Atlas", voice, "a3f8", width, height, framed) == expected
+
+
+def test_compact_uses_first_row():
+    """compact() shows the first matrix row, the name and the short hash."""
+    traits = {"warmth": 0.9, "humor": 0.1}
+    row = reference_matrix(traits, "Atlas", "a3f8c0", 12, 3)[0]
+    assert compact(traits, "Atlas", "a3f8c0") == f"{row} Atlas [a3f8]"